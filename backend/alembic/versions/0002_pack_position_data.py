@@ -0,0 +1,58 @@
+"""pack GameWord.position_data into an integer
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.maker.positions import encode_coordinates, position_cells
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _convert(column_type: sa.types.TypeEngine, convert) -> None:
+    """Rewrite position_data through a temporary column of ``column_type``."""
+    conn = op.get_bind()
+    with op.batch_alter_table("game_words") as batch:
+        batch.add_column(sa.Column("position_new", column_type, nullable=True))
+    rows = conn.execute(sa.text("SELECT id, position_data FROM game_words")).all()
+    for word_id, value in rows:
+        conn.execute(
+            sa.text("UPDATE game_words SET position_new = :value WHERE id = :id"),
+            {"value": convert(value), "id": word_id},
+        )
+    with op.batch_alter_table("game_words") as batch:
+        batch.drop_column("position_data")
+        batch.alter_column(
+            "position_new",
+            new_column_name="position_data",
+            existing_type=column_type,
+            nullable=False,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert(
+        sa.BigInteger(),
+        lambda value: encode_coordinates(json.loads(value) if isinstance(value, str) else value),
+    )
+    # Cached payloads carry the old coordinate-list format.
+    op.execute("DELETE FROM puzzle_cache")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert(sa.JSON(), lambda value: json.dumps([list(cell) for cell in position_cells(value)]))
+    op.execute("DELETE FROM puzzle_cache")
@@ -0,0 +1,52 @@
+"""add Game.difficulty
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.maker.difficulty import difficulty_score
+from app.maker.grid import Grid, Placement, encode_word
+from app.maker.positions import decode_position
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("games") as batch:
+        batch.add_column(sa.Column("difficulty", sa.Float(), nullable=True))
+        batch.create_index("ix_games_difficulty", ["difficulty"])
+
+    conn = op.get_bind()
+    words: dict[int, list[Placement]] = {}
+    for game_id, word, packed in conn.execute(
+        sa.text("SELECT game_id, word, position_data FROM game_words")
+    ):
+        words.setdefault(game_id, []).append(Placement(word, *decode_position(packed)[:3]))
+    for game_id, rows, cols, text in conn.execute(
+        sa.text("SELECT id, rows, cols, grid FROM games")
+    ).all():
+        grid = Grid(rows, cols)
+        grid.cells[:] = encode_word(text.replace("\n", ""))
+        conn.execute(
+            sa.text("UPDATE games SET difficulty = :score WHERE id = :id"),
+            {"score": difficulty_score(grid, words.get(game_id, [])), "id": game_id},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("games") as batch:
+        batch.drop_index("ix_games_difficulty")
+        batch.drop_column("difficulty")
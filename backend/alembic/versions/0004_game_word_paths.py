@@ -0,0 +1,33 @@
+"""add GameWord.path for snaking words
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("game_words") as batch:
+        batch.add_column(sa.Column("path", sa.Text(), nullable=True))
+        batch.alter_column("position_data", existing_type=sa.BigInteger(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM game_words WHERE position_data IS NULL")
+    with op.batch_alter_table("game_words") as batch:
+        batch.alter_column("position_data", existing_type=sa.BigInteger(), nullable=False)
+        batch.drop_column("path")
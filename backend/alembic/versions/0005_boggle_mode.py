@@ -0,0 +1,34 @@
+"""add Game.mode and Game.boggle_words
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("games") as batch:
+        batch.add_column(
+            sa.Column("mode", sa.String(length=16), nullable=False, server_default="classic")
+        )
+        batch.add_column(sa.Column("boggle_words", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("games") as batch:
+        batch.drop_column("boggle_words")
+        batch.drop_column("mode")
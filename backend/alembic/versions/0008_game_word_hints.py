@@ -0,0 +1,52 @@
+"""add GameWord.hints
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.hints import encode_hints, word_hints
+from app.maker.paths import PATH_DIRECTION, decode_path
+from app.maker.positions import decode_position, position_cells
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("game_words") as batch:
+        batch.add_column(sa.Column("hints", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    for word_id, packed, path, rows, cols in conn.execute(
+        sa.text(
+            "SELECT game_words.id, position_data, path, rows, cols "
+            "FROM game_words JOIN games ON games.id = game_words.game_id"
+        )
+    ).all():
+        if path is not None:
+            cells = [divmod(cell, cols) for cell in decode_path(path)]
+            direction = PATH_DIRECTION
+        else:
+            cells = position_cells(packed)
+            direction = decode_position(packed)[2]
+        conn.execute(
+            sa.text("UPDATE game_words SET hints = :hints WHERE id = :id"),
+            {"hints": encode_hints(word_hints(cells, direction, rows, cols)), "id": word_id},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("game_words") as batch:
+        batch.drop_column("hints")
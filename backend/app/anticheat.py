@@ -0,0 +1,175 @@
+"""Streaming detection of scripted play.
+
+Submission handlers hand each batch of finds to :data:`analyzer` as a
+:class:`FindEvent` and return; a background task folds the events into a
+fixed-size :class:`PlayStats` per participant (counts, sums and a Welford
+running variance of the gaps between submissions) and checks them against
+human limits:
+
+* ``too_fast``: more than a few words found, averaging under
+  ``MIN_SECONDS_PER_WORD`` each since joining (40 words in 3 seconds).
+* ``too_quick_drag``: selections covering more than ``MAX_CELLS_PER_SECOND``
+  grid cells per second of play.
+* ``too_regular``: submission gaps so even (coefficient of variation under
+  ``MIN_GAP_VARIATION``) that they come from a timer, not a person.
+
+A flag is written to ``GameParticipant.flagged`` once, so the database is
+touched only for flagged participants.  Statistics for at most
+``settings.anticheat_max_tracked`` participants are kept, least recently
+active first out, and events are dropped rather than queued without bound
+when the analyzer falls behind.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import update
+from starlette.concurrency import run_in_threadpool
+
+from .config import settings
+from .database import SessionLocal
+from .models import GameParticipant
+
+logger = logging.getLogger(__name__)
+
+MIN_SECONDS_PER_WORD = 0.75
+MAX_CELLS_PER_SECOND = 20.0
+MIN_GAP_VARIATION = 0.05
+# Finds (or submissions, for regularity) needed before a rule may fire.
+MIN_FINDS = 5
+MIN_GAPS = 8
+
+QUEUE_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class FindEvent:
+    participant_id: int
+    # Server receive time and join time, both Unix seconds.
+    at: float
+    joined_at: float
+    # New words in this submission and the grid cells their selections span.
+    words: int
+    cells: int
+
+
+@dataclass
+class PlayStats:
+    """Constant-size running statistics for one participant."""
+
+    joined_at: float
+    words: int = 0
+    cells: int = 0
+    last_at: float | None = None
+    gaps: int = 0
+    gap_mean: float = 0.0
+    # Sum of squared deviations from the mean (Welford).
+    gap_m2: float = 0.0
+    flagged: bool = False
+
+    def add(self, event: FindEvent) -> None:
+        self.words += event.words
+        self.cells += event.cells
+        if self.last_at is not None:
+            gap = event.at - self.last_at
+            self.gaps += 1
+            delta = gap - self.gap_mean
+            self.gap_mean += delta / self.gaps
+            self.gap_m2 += delta * (gap - self.gap_mean)
+        self.last_at = event.at
+
+    def verdict(self) -> str | None:
+        if self.words >= MIN_FINDS:
+            elapsed = max(self.last_at - self.joined_at, 1e-3)
+            if elapsed / self.words < MIN_SECONDS_PER_WORD:
+                return "too_fast"
+            if self.cells / elapsed > MAX_CELLS_PER_SECOND:
+                return "too_quick_drag"
+        if self.gaps >= MIN_GAPS and self.gap_mean > 0:
+            spread = math.sqrt(self.gap_m2 / (self.gaps - 1))
+            if spread / self.gap_mean < MIN_GAP_VARIATION:
+                return "too_regular"
+        return None
+
+
+class PlayAnalyzer:
+    def __init__(self, max_tracked: int) -> None:
+        self.max_tracked = max_tracked
+        self._stats: OrderedDict[int, PlayStats] = OrderedDict()
+        self._queue: asyncio.Queue[FindEvent] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self.dropped = 0
+
+    def submit(self, event: FindEvent) -> None:
+        """Queue ``event``; safe to call from request worker threads."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._enqueue, event)
+
+    def _enqueue(self, event: FindEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def observe(self, event: FindEvent) -> str | None:
+        """Fold ``event`` into its participant's stats; a new flag, if any."""
+        stats = self._stats.get(event.participant_id)
+        if stats is None:
+            stats = self._stats[event.participant_id] = PlayStats(event.joined_at)
+            while len(self._stats) > self.max_tracked:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(event.participant_id)
+        stats.add(event)
+        if stats.flagged:
+            return None
+        reason = stats.verdict()
+        stats.flagged = reason is not None
+        return reason
+
+    async def run(self) -> None:
+        while True:
+            event = await self._queue.get()
+            reason = self.observe(event)
+            if reason is not None:
+                try:
+                    await run_in_threadpool(_store_flag, event.participant_id, reason)
+                except Exception:
+                    logger.exception("could not flag participant %s", event.participant_id)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(QUEUE_SIZE)
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._loop = None
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def _store_flag(participant_id: int, reason: str) -> None:
+    logger.warning("flagging participant %s: %s", participant_id, reason)
+    with SessionLocal() as db:
+        db.execute(
+            update(GameParticipant)
+            .where(GameParticipant.id == participant_id, GameParticipant.flagged.is_(None))
+            .values(flagged=reason)
+        )
+        db.commit()
+
+
+analyzer = PlayAnalyzer(settings.anticheat_max_tracked)
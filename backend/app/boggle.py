@@ -0,0 +1,133 @@
+"""Boggle mode: score any dictionary word traced through adjacent cells.
+
+When a Boggle game is created, every dictionary word that can be traced in
+its grid (8-neighbour steps, no cell used twice in one word) is found with
+a depth-first search guided by a trie of the dictionary: a walk stops as
+soon as its letters stop being a prefix of some word, so the search visits
+only real prefixes instead of every path.  The answers are stored with the
+game, sorted and zlib-compressed.  A player submits the cells they traced;
+:func:`traced_word` checks the path and reads its letters, and scoring it
+is a set lookup plus :func:`word_points`.
+"""
+
+from __future__ import annotations
+
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from .config import settings
+from .maker import normalize_word
+from .maker.paths import adjacency
+from .maker.themes import THEMES
+
+MIN_LENGTH = 3
+# Points per word length, as in the board game; longer words score the last.
+POINTS = {3: 1, 4: 1, 5: 2, 6: 3, 7: 5}
+LONG_WORD_POINTS = 11
+
+
+class Trie:
+    """Prefix tree over normalized words, stored as parallel lists of nodes."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.children: list[dict[str, int]] = [{}]
+        self.word: list[str | None] = [None]
+        for word in words:
+            node = 0
+            for ch in word:
+                following = self.children[node].get(ch)
+                if following is None:
+                    following = len(self.children)
+                    self.children[node][ch] = following
+                    self.children.append({})
+                    self.word.append(None)
+                node = following
+            self.word[node] = word
+
+
+def _dictionary_words(lines: Iterable[str]) -> set[str]:
+    words = (normalize_word(line) for line in lines)
+    return {w for w in words if len(w) >= MIN_LENGTH and w.isalpha()}
+
+
+@lru_cache(maxsize=1)
+def dictionary_trie() -> Trie:
+    """Trie of ``settings.boggle_dictionary`` (one word per line).
+
+    Without a configured file the built-in theme word lists are used.
+    Loaded once per process.
+    """
+    if settings.boggle_dictionary:
+        with Path(settings.boggle_dictionary).open(encoding="utf-8") as f:
+            return Trie(sorted(_dictionary_words(f)))
+    return Trie(sorted(_dictionary_words(w for words in THEMES.values() for w in words)))
+
+
+def findable_words(grid: Sequence[str], trie: Trie | None = None) -> set[str]:
+    """Every dictionary word that can be traced in ``grid``."""
+    trie = trie or dictionary_trie()
+    rows, cols = len(grid), len(grid[0])
+    letters = "".join(grid).upper()
+    neighbours = adjacency(rows, cols, 8).tolist()
+    children, terminal = trie.children, trie.word
+    found: set[str] = set()
+    visited = [False] * len(letters)
+
+    def walk(cell: int, node: int) -> None:
+        if terminal[node] is not None:
+            found.add(terminal[node])
+        visited[cell] = True
+        branches = children[node]
+        for following in neighbours[cell]:
+            if following < 0 or visited[following]:
+                continue
+            child = branches.get(letters[following])
+            if child is not None:
+                walk(following, child)
+        visited[cell] = False
+
+    for cell, letter in enumerate(letters):
+        node = children[0].get(letter)
+        if node is not None:
+            walk(cell, node)
+    return found
+
+
+def traced_word(grid: Sequence[str], cells: Sequence[tuple[int, int]]) -> str:
+    """The letters along ``cells``, which must be a valid Boggle path.
+
+    Each step goes to one of the 8 neighbouring cells and no cell is used
+    twice; anything else raises ValueError.
+    """
+    rows, cols = len(grid), len(grid[0])
+    for row, col in cells:
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise ValueError(f"cell ({row}, {col}) is outside the grid")
+    if len(set(cells)) != len(cells):
+        raise ValueError("a cell is used more than once")
+    for (r0, c0), (r1, c1) in zip(cells, cells[1:]):
+        if max(abs(r1 - r0), abs(c1 - c0)) != 1:
+            raise ValueError(f"cells ({r0}, {c0}) and ({r1}, {c1}) are not adjacent")
+    return "".join(grid[row][col] for row, col in cells).upper()
+
+
+def word_points(word: str) -> int:
+    # Answers are at least MIN_LENGTH letters long.
+    return POINTS.get(len(word), LONG_WORD_POINTS)
+
+
+def pack_words(words: Iterable[str]) -> bytes:
+    """Sorted, newline-separated and zlib-compressed."""
+    return zlib.compress("\n".join(sorted(words)).encode("utf-8"), 9)
+
+
+def unpack_words(data: bytes) -> frozenset[str]:
+    text = zlib.decompress(data).decode("utf-8")
+    return frozenset(text.split("\n")) if text else frozenset()
+
+
+def answer_blob(grid: Sequence[str]) -> bytes:
+    """Packed answer set of ``grid``; runs in a worker process."""
+    return pack_words(findable_words(grid))
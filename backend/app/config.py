@@ -0,0 +1,49 @@
+"""Application settings, read from the environment (and ``backend/.env``)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+
+def _int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+class Settings:
+    database_url: str = os.getenv("DATABASE_URL", "sqlite:///./wordsearch.db")
+    # Worker processes used for puzzle generation; 0 means one per CPU.
+    maker_workers: int = _int("MAKER_WORKERS", 0)
+    # Largest number of puzzle specs accepted by one batch request.
+    maker_batch_limit: int = _int("MAKER_BATCH_LIMIT", 500)
+    # Largest number of grids accepted by one solver batch request.
+    solver_batch_limit: int = _int("SOLVER_BATCH_LIMIT", 50_000)
+    # Puzzles kept in the in-memory tier of the generation cache.
+    maker_cache_size: int = _int("MAKER_CACHE_SIZE", 1024)
+    # Ready-made quick play puzzles kept per (theme, size, difficulty) bucket.
+    inventory_target_depth: int = _int("INVENTORY_TARGET_DEPTH", 5)
+    # Puzzles the background worker generates per second while refilling.
+    inventory_refill_rate: float = _float("INVENTORY_REFILL_RATE", 2.0)
+    # Games (grid, words and answer lookup tables) kept in memory by link code.
+    game_cache_size: int = _int("GAME_CACHE_SIZE", 1024)
+    # Seconds a cached game is served before it is read from the database again.
+    game_cache_ttl: float = _float("GAME_CACHE_TTL", 300.0)
+    # Participants whose play statistics the anti-cheat analyzer keeps.
+    anticheat_max_tracked: int = _int("ANTICHEAT_MAX_TRACKED", 100_000)
+    # Directory of per-game binary replay logs (app.replay).
+    replay_dir: str = os.getenv("REPLAY_DIR", "./replays")
+    # Word list (one per line) for Boggle games; empty uses the theme words.
+    boggle_dictionary: str = os.getenv("BOGGLE_DICTIONARY", "")
+
+
+settings = Settings()
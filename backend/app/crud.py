@@ -0,0 +1,308 @@
+"""Database helpers shared by the routers."""
+
+from __future__ import annotations
+
+import secrets
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+
+from .game_cache import game_cache
+from .hints import encode_hints, word_hints
+from .maker.difficulty import difficulty_score
+from .maker.grid import DIRECTION_NAMES, Placement
+from .maker.paths import PathPlacement, decode_path, encode_path
+from .maker.positions import decode_position, encode_position
+from .maker.relayout import relayout
+from .models import Game, GameParticipant, GameWord
+from .progress import MAX_WORDS, full_mask, remap
+
+
+class StaleGameError(Exception):
+    """The game's words were edited since the caller looked them up."""
+
+
+_SUMMARY_COLUMNS = (
+    Game.id, Game.title, Game.link_code, Game.rows, Game.cols, Game.difficulty, Game.created_at,
+)
+
+
+def generate_link_code(db: Session) -> str:
+    """Return a short URL-safe code not yet used by any game."""
+    while True:
+        code = secrets.token_urlsafe(6)
+        if db.scalar(select(Game.id).where(Game.link_code == code)) is None:
+            return code
+
+
+def create_game(
+    db: Session,
+    puzzle: dict,
+    title: str,
+    description: str | None = None,
+    creator_id: int | None = None,
+    mode: str = "classic",
+    boggle_words: bytes | None = None,
+) -> Game:
+    """Persist a Maker payload (``Puzzle.to_dict()``) as a Game with its words.
+
+    Boggle games take their packed answer set (:func:`app.boggle.answer_blob`)
+    in ``boggle_words``.  Each word's hints are worked out here, once.
+    Classic games are refused past ``MAX_WORDS`` words, since no player
+    could then join.
+    """
+    if mode == "classic" and len(puzzle["words"]) > MAX_WORDS:
+        raise ValueError(f"progress can be tracked for at most {MAX_WORDS} words")
+    game = Game(
+        title=title,
+        description=description,
+        creator_id=creator_id,
+        link_code=generate_link_code(db),
+        rows=puzzle["rows"],
+        cols=puzzle["cols"],
+        grid="\n".join(puzzle["grid"]),
+        difficulty=puzzle.get("difficulty"),
+        mode=mode,
+        boggle_words=boggle_words,
+        message=puzzle.get("message"),
+        words=[
+            GameWord(
+                word=w["word"],
+                position_data=w["position_data"],
+                path=encode_path(w["path"]) if w.get("path") else None,
+            )
+            for w in puzzle["words"]
+        ],
+    )
+    for word in game.words:
+        word.hints = _hints(word_placement(word, game.cols), game.rows, game.cols)
+    db.add(game)
+    db.commit()
+    db.refresh(game)
+    return game
+
+
+def list_games(
+    db: Session,
+    min_difficulty: float | None = None,
+    max_difficulty: float | None = None,
+    sort: str = "-created_at",
+    limit: int = 50,
+    offset: int = 0,
+) -> list[Game]:
+    """Game rows without their grids, filtered and sorted on indexed columns."""
+    query = select(Game).options(load_only(*_SUMMARY_COLUMNS))
+    if min_difficulty is not None:
+        query = query.where(Game.difficulty >= min_difficulty)
+    if max_difficulty is not None:
+        query = query.where(Game.difficulty <= max_difficulty)
+    column = getattr(Game, sort.lstrip("-"))
+    query = query.order_by(column.desc() if sort.startswith("-") else column.asc(), Game.id)
+    return list(db.scalars(query.limit(limit).offset(offset)))
+
+
+def get_game_by_link_code(db: Session, link_code: str) -> Game | None:
+    return db.scalar(select(Game).where(Game.link_code == link_code))
+
+
+def word_placement(word: GameWord, cols: int) -> Placement | PathPlacement:
+    if word.path is not None:
+        return PathPlacement(word.word, decode_path(word.path), cols)
+    return Placement(word.word, *decode_position(word.position_data)[:3])
+
+
+def game_placements(game: Game) -> list[Placement | PathPlacement]:
+    return [word_placement(w, game.cols) for w in game.words]
+
+
+def _hints(placement: Placement | PathPlacement, rows: int, cols: int) -> str:
+    return encode_hints(word_hints(placement.coordinates(), placement.direction, rows, cols))
+
+
+def update_game_words(
+    db: Session,
+    game: Game,
+    words: list[str],
+    directions: list[str] | None = None,
+    seed: int | None = None,
+) -> Game:
+    """Apply a new word list to ``game`` touching only the words that changed.
+
+    Rows of kept words are left alone; removed words are deleted, added
+    words inserted and the grid rewritten with repaired filler.  Without
+    explicit ``directions`` new words use those already in the puzzle.
+    Participants keep the words they found that are still in the game.
+    """
+    if any(w.path is not None for w in game.words):
+        raise ValueError("the words of a snaking puzzle cannot be edited")
+    if game.message is not None:
+        # Relayout would treat the message cells as filler and re-roll them.
+        raise ValueError("the words of a hidden-message puzzle cannot be edited")
+    if game.mode == "boggle":
+        # Its answers are every word traceable in the grid, not just these.
+        raise ValueError("the words of a Boggle game cannot be edited")
+    old_ids = [w.id for w in game.words]
+    placements = game_placements(game)
+    if directions is None:
+        directions = [p.direction for p in placements] or list(DIRECTION_NAMES)
+    result = relayout(game.grid.split("\n"), placements, words, directions, seed=seed)
+    if len(result.kept) + len(result.added) > MAX_WORDS:
+        raise ValueError(f"progress can be tracked for at most {MAX_WORDS} words")
+    removed = {p.word for p in result.removed}
+    for word in [w for w in game.words if w.word in removed]:
+        game.words.remove(word)
+    for p in result.added:
+        game.words.append(
+            GameWord(
+                word=p.word,
+                position_data=encode_position(p.row, p.col, p.direction, p.length),
+                hints=_hints(p, game.rows, game.cols),
+            )
+        )
+    game.grid = "\n".join(result.grid.to_rows())
+    game.difficulty = difficulty_score(result.grid, result.kept + result.added)
+    game.words_version += 1
+    db.flush()
+    new_ids = [w.id for w in game.words]
+    for participant in game.participants:
+        _remap_progress(db, participant, old_ids, new_ids)
+    db.commit()
+    game_cache.invalidate(game.link_code)
+    db.refresh(game)
+    return game
+
+
+def _remap_progress(
+    db: Session, participant: GameParticipant, old_ids: list[int], new_ids: list[int]
+) -> None:
+    """Carry a participant's progress over to the new word order.
+
+    Conditional on the bitmap that was read, like :func:`record_found`, so
+    a find recorded concurrently (against the old order) is re-read and
+    remapped rather than overwritten.
+    """
+    while True:
+        old = participant.found_words
+        found = remap(old, old_ids, new_ids)
+        values = {"found_words": found, "score": found.bit_count()}
+        if found != full_mask(len(new_ids)):
+            values["completion_time"] = None
+        result = db.execute(
+            update(GameParticipant)
+            .where(GameParticipant.id == participant.id, GameParticipant.found_words == old)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            for name, value in values.items():
+                set_committed_value(participant, name, value)
+            return
+        db.refresh(participant, ["found_words"])
+
+
+def as_utc(moment: datetime) -> datetime:
+    # SQLite hands back naive datetimes; they were stored as UTC.
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+def join_game(db: Session, game_id: int, word_count: int, username: str) -> GameParticipant:
+    if word_count > MAX_WORDS:
+        raise ValueError(f"progress can be tracked for at most {MAX_WORDS} words")
+    participant = GameParticipant(game_id=game_id, username=username)
+    db.add(participant)
+    db.commit()
+    db.refresh(participant)
+    return participant
+
+
+def get_participant(db: Session, game_id: int, participant_id: int) -> GameParticipant | None:
+    participant = db.get(GameParticipant, participant_id)
+    return participant if participant is not None and participant.game_id == game_id else None
+
+
+def record_boggle_word(
+    db: Session, participant: GameParticipant, word: str, points: int
+) -> bool:
+    """Add ``word`` to the participant's Boggle finds and score it, once.
+
+    Written with the same conditional UPDATE as :func:`record_found`,
+    guarded by the word list it was computed from.  Returns whether the
+    word was new.
+    """
+    while True:
+        old = participant.boggle_words
+        found = set(old.split("\n")) if old else set()
+        if word in found:
+            return False
+        values = {
+            "boggle_words": "\n".join(sorted(found | {word})),
+            "score": participant.score + points,
+        }
+        unchanged = (
+            GameParticipant.boggle_words.is_(None)
+            if old is None
+            else GameParticipant.boggle_words == old
+        )
+        result = db.execute(
+            update(GameParticipant)
+            .where(GameParticipant.id == participant.id, unchanged)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if not result.rowcount:
+            db.refresh(participant)
+            continue
+        for name, value in values.items():
+            set_committed_value(participant, name, value)
+        return True
+
+
+def record_found(
+    db: Session, participant: GameParticipant, bits: int, word_count: int, version: int
+) -> GameParticipant:
+    """Mark the words in ``bits`` found with one conditional UPDATE.
+
+    Bitmap, score and completion time are written together, guarded by the
+    bitmap the new state was computed from; if a concurrent submission got
+    there first the row is re-read and the merge retried, so no found word
+    is ever lost.  Nothing is written when every word was already found.
+
+    ``bits`` are ordinals in the word order of ``Game.words_version``
+    ``version``; the same UPDATE checks that version is still current and
+    raises :class:`StaleGameError` when the words have been edited since.
+    """
+    current_version = (
+        select(Game.words_version).where(Game.id == GameParticipant.game_id).scalar_subquery()
+    )
+    while True:
+        old = participant.found_words
+        found = old | bits
+        if found == old:
+            return participant
+        values = {"found_words": found, "score": found.bit_count()}
+        if found == full_mask(word_count) and participant.completion_time is None:
+            elapsed = datetime.now(timezone.utc) - as_utc(participant.created_at)
+            values["completion_time"] = elapsed.total_seconds()
+        result = db.execute(
+            update(GameParticipant)
+            .where(
+                GameParticipant.id == participant.id,
+                GameParticipant.found_words == old,
+                current_version == version,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if not result.rowcount:
+            db.refresh(participant)
+            latest = db.scalar(select(Game.words_version).where(Game.id == participant.game_id))
+            if latest != version:
+                raise StaleGameError(f"game {participant.game_id} was edited")
+            continue
+        for name, value in values.items():
+            set_committed_value(participant, name, value)
+        return participant
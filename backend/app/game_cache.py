@@ -0,0 +1,119 @@
+"""In-process cache of hot games, keyed by link code.
+
+A live event sends hundreds of players to the same game within seconds,
+and each would otherwise read the same ``Game`` and ``GameWord`` rows.  A
+:class:`GameState` holds everything the play endpoints need (the serialized
+game, its :class:`~app.selections.SelectionIndex` and the words' hints) in
+a bounded LRU whose entries expire after ``settings.game_cache_ttl``
+seconds.  Concurrent misses on one link code are collapsed into a single
+database read.
+
+Editing a game must :meth:`~GameCache.invalidate` its entry, but that only
+reaches the process doing the edit.  Other processes find out when a write
+guarded by :attr:`GameState.version` is refused (see
+:func:`app.crud.record_found`).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload, undefer
+
+from .config import settings
+from .hints import decode_hints
+from .models import Game
+from .schemas import GameOut
+from .selections import SelectionIndex
+
+
+@dataclass(frozen=True)
+class GameState:
+    id: int
+    link_code: str
+    mode: str
+    # Game.words_version the index and word ordinals were built from.
+    version: int
+    word_count: int
+    # GameOut as plain data, ready to be returned as is.
+    payload: dict
+    index: SelectionIndex
+    # Word id -> ordered hints.
+    hints: dict[int, list[dict]]
+    expires: float
+
+
+class GameCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._games: OrderedDict[str, GameState] = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per link code being loaded, so a burst of misses reads once.
+        self._loading: dict[str, threading.Lock] = {}
+
+    def get(self, db: Session, link_code: str) -> GameState | None:
+        state = self._cached(link_code)
+        if state is not None:
+            return state
+        with self._lock:
+            loading = self._loading.setdefault(link_code, threading.Lock())
+        with loading:
+            # Another request may have loaded it while this one waited.
+            state = self._cached(link_code)
+            if state is None:
+                state = self._load(db, link_code)
+            with self._lock:
+                self._loading.pop(link_code, None)
+                if state is not None:
+                    self._games[link_code] = state
+                    self._games.move_to_end(link_code)
+                    while len(self._games) > self.maxsize:
+                        self._games.popitem(last=False)
+        return state
+
+    def _cached(self, link_code: str) -> GameState | None:
+        with self._lock:
+            state = self._games.get(link_code)
+            if state is None:
+                return None
+            if state.expires <= time.monotonic():
+                del self._games[link_code]
+                return None
+            self._games.move_to_end(link_code)
+            return state
+
+    def _load(self, db: Session, link_code: str) -> GameState | None:
+        game = db.scalar(
+            select(Game)
+            .options(selectinload(Game.words), undefer(Game.boggle_words))
+            .where(Game.link_code == link_code)
+        )
+        if game is None:
+            return None
+        return GameState(
+            id=game.id,
+            link_code=game.link_code,
+            mode=game.mode,
+            version=game.words_version,
+            word_count=len(game.words),
+            payload=GameOut.model_validate(game).model_dump(),
+            index=SelectionIndex(game),
+            hints={w.id: decode_hints(w.hints) for w in game.words if w.hints is not None},
+            expires=time.monotonic() + self.ttl,
+        )
+
+    def invalidate(self, link_code: str) -> None:
+        with self._lock:
+            self._games.pop(link_code, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._games.clear()
+
+
+game_cache = GameCache(settings.game_cache_size, settings.game_cache_ttl)
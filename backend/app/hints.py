@@ -0,0 +1,37 @@
+"""Hints for a placed word, computed once when the word is placed.
+
+Each word gets an ordered list, least revealing first: the quadrant of the
+grid where it starts, the direction it reads (``"path"`` for snaking
+words), then the cell of its first letter.  The list is stored as JSON on
+``GameWord.hints``, so serving the ``n``-th hint is a lookup.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Sequence
+
+
+def quadrant(row: int, col: int, rows: int, cols: int) -> str:
+    vertical = "top" if 2 * row < rows else "bottom"
+    horizontal = "left" if 2 * col < cols else "right"
+    return f"{vertical}-{horizontal}"
+
+
+def word_hints(
+    coordinates: Sequence[tuple[int, int]], direction: str, rows: int, cols: int
+) -> list[dict]:
+    row, col = coordinates[0]
+    return [
+        {"kind": "quadrant", "value": quadrant(row, col, rows, cols)},
+        {"kind": "direction", "value": direction},
+        {"kind": "first_cell", "value": [row, col]},
+    ]
+
+
+def encode_hints(hints: list[dict]) -> str:
+    return json.dumps(hints, separators=(",", ":"))
+
+
+def decode_hints(text: str) -> list[dict]:
+    return json.loads(text)
@@ -0,0 +1,106 @@
+"""Warm inventory of pre-generated quick play puzzles.
+
+A background task keeps every (theme, size, difficulty) bucket topped up to
+``settings.inventory_target_depth`` puzzles, generating at most
+``settings.inventory_refill_rate`` puzzles per second on the Maker process
+pool.  Quick play then pops a finished puzzle instead of generating one on
+the request path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections import deque
+from itertools import product
+from typing import NamedTuple
+
+from .config import settings
+from .maker.batch import generate_puzzle, get_executor
+from .maker.themes import DIFFICULTIES, QUICK_PLAY_SIZES, THEMES
+
+logger = logging.getLogger(__name__)
+
+
+class Bucket(NamedTuple):
+    theme: str
+    size: int
+    difficulty: str
+
+
+def bucket_spec(bucket: Bucket, seed: int) -> dict:
+    """Maker spec for one puzzle of ``bucket``; the seed also picks the words."""
+    preset = DIFFICULTIES[bucket.difficulty]
+    words = [w for w in THEMES[bucket.theme] if len(w) <= bucket.size]
+    count = min(preset["word_count"], len(words))
+    return {
+        "title": f"{bucket.theme.title()} ({bucket.difficulty})",
+        "words": random.Random(seed).sample(words, count),
+        "size": bucket.size,
+        "directions": preset["directions"],
+        "seed": seed,
+        "strategy": "backtrack",
+    }
+
+
+async def generate_for(bucket: Bucket) -> dict:
+    spec = bucket_spec(bucket, random.getrandbits(31))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), generate_puzzle, spec)
+
+
+class PuzzleInventory:
+    def __init__(self, target_depth: int, refill_rate: float) -> None:
+        self.target_depth = target_depth
+        self.refill_rate = refill_rate
+        self._stock: dict[Bucket, deque[dict]] = {
+            Bucket(*key): deque()
+            for key in product(THEMES, QUICK_PLAY_SIZES, DIFFICULTIES)
+        }
+        self._task: asyncio.Task | None = None
+
+    def pop(self, bucket: Bucket) -> dict | None:
+        stock = self._stock[bucket]
+        return stock.popleft() if stock else None
+
+    def depth(self) -> dict[Bucket, int]:
+        return {bucket: len(stock) for bucket, stock in self._stock.items()}
+
+    def _most_depleted(self) -> Bucket | None:
+        bucket = min(self._stock, key=lambda b: len(self._stock[b]))
+        return bucket if len(self._stock[bucket]) < self.target_depth else None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.refill_rate
+        while True:
+            started = loop.time()
+            bucket = self._most_depleted()
+            if bucket is not None:
+                try:
+                    puzzle = await generate_for(bucket)
+                except Exception:
+                    logger.exception("inventory refill failed for %s", bucket)
+                else:
+                    if "error" in puzzle:
+                        logger.warning("inventory spec for %s failed: %s", bucket, puzzle["error"])
+                    else:
+                        self._stock[bucket].append(puzzle)
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+    def start(self) -> None:
+        if self._task is None and self.target_depth > 0 and self.refill_rate > 0:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+inventory = PuzzleInventory(settings.inventory_target_depth, settings.inventory_refill_rate)
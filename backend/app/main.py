@@ -0,0 +1,30 @@
+"""FastAPI application entry point."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from .anticheat import analyzer
+from .database import run_migrations
+from .inventory import inventory
+from .maker.batch import shutdown_executor
+from .routers import games, maker, solver
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    run_migrations()
+    inventory.start()
+    analyzer.start()
+    yield
+    await analyzer.stop()
+    await inventory.stop()
+    shutdown_executor()
+
+
+app = FastAPI(title="Word Search", lifespan=lifespan)
+app.include_router(maker.router)
+app.include_router(games.router)
+app.include_router(solver.router)
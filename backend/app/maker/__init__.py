@@ -0,0 +1,18 @@
+"""Word Search Maker: grid generation engine."""
+
+from .alphabet import ALPHABETS, normalize_word
+from .errors import PlacementError
+from .grid import DIRECTION_NAMES, DIRECTIONS, Grid, Placement
+from .maker import Maker, Puzzle
+
+__all__ = [
+    "ALPHABETS",
+    "DIRECTIONS",
+    "DIRECTION_NAMES",
+    "Grid",
+    "Maker",
+    "Placement",
+    "PlacementError",
+    "Puzzle",
+    "normalize_word",
+]
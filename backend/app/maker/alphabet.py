@@ -0,0 +1,161 @@
+"""Alphabets: how words are normalized and which letters fill empty cells.
+
+Every alphabet works on integer code point arrays, the same representation
+as the grid.  Filler distributions are computed once at import time so
+sampling is a single vectorized draw per fill.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from .grid import decode_cells, encode_word
+
+LATIN_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+_JUNG_COUNT = 21
+_JONG_COUNT = 28
+_CHOSEONG = encode_word("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+_JUNGSEONG = encode_word("ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ")
+# Index 0 is "no final consonant".
+_JONGSEONG = np.concatenate(
+    [[0], encode_word("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")]
+).astype(np.uint32)
+_COMPAT_JAMO_FIRST = 0x3131
+_COMPAT_JAMO_LAST = 0x3163
+
+# Common syllables in Korean text, most frequent first.  Weights follow
+# Zipf's law over this rank order.
+COMMON_SYLLABLES = (
+    "이다는의에하고을가지서한기로사리대자도정수시들있인어나장아전를일부보해게적주것으"
+    "만상성국제라와위과우동구여관원소면경방화연신비생무공안계러개문되회마내세선중치요"
+    "재진오조발식미간용물실학행산명금점체당영유현거교통법민결합분반음호심파차업르단강"
+    "모본터출외입불말알각작품양날저함랑월년"
+)
+
+
+def normalize_word(word: str) -> str:
+    """Upper-case ``word`` and drop spaces and hyphens."""
+    return "".join(ch for ch in word.upper() if not ch.isspace() and ch != "-")
+
+
+class Alphabet:
+    """Word normalization plus a filler letter distribution."""
+
+    name: str
+
+    def __init__(self, symbols: np.ndarray, weights: np.ndarray | None = None) -> None:
+        self.symbols = symbols.astype(np.uint32)
+        self._cumulative = None
+        if weights is not None:
+            cumulative = np.cumsum(weights, dtype=np.float64)
+            self._cumulative = cumulative / cumulative[-1]
+
+    def normalize(self, word: str) -> str:
+        return normalize_word(word)
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        if self._cumulative is None:
+            return self.symbols[rng.integers(self.symbols.size, size=n)]
+        picks = np.searchsorted(self._cumulative, rng.random(n), side="right")
+        return self.symbols[np.minimum(picks, self.symbols.size - 1)]
+
+    def sampler(self, rng: np.random.Generator) -> Callable[[int], np.ndarray]:
+        return lambda n: self.sample(rng, n)
+
+
+class LatinAlphabet(Alphabet):
+    name = "latin"
+
+    def __init__(self) -> None:
+        super().__init__(encode_word(LATIN_LETTERS))
+
+
+def _is_syllable(codes: np.ndarray) -> np.ndarray:
+    return (codes >= HANGUL_BASE) & (codes <= HANGUL_LAST)
+
+
+def _is_compat_jamo(codes: np.ndarray) -> np.ndarray:
+    return (codes >= _COMPAT_JAMO_FIRST) & (codes <= _COMPAT_JAMO_LAST)
+
+
+def _jamo_slots(codes: np.ndarray) -> np.ndarray:
+    """``(n, 3)`` initial, medial and final jamo per code; 0 marks an unused slot."""
+    syllable = _is_syllable(codes)
+    offset = np.where(syllable, codes.astype(np.int64) - HANGUL_BASE, 0)
+    return np.stack(
+        [
+            np.where(syllable, _CHOSEONG[offset // (_JUNG_COUNT * _JONG_COUNT)], codes),
+            np.where(syllable, _JUNGSEONG[offset % (_JUNG_COUNT * _JONG_COUNT) // _JONG_COUNT], 0),
+            np.where(syllable, _JONGSEONG[offset % _JONG_COUNT], 0),
+        ],
+        axis=1,
+    ).astype(np.uint32)
+
+
+def decompose(codes: np.ndarray) -> np.ndarray:
+    """Split precomposed syllables into compatibility jamo; jamo pass through."""
+    parts = _jamo_slots(codes).ravel()
+    return parts[parts != 0]
+
+
+def _hangul_codes(word: str) -> np.ndarray:
+    return encode_word("".join(ch for ch in word if not ch.isspace() and ch != "-"))
+
+
+class HangulSyllableAlphabet(Alphabet):
+    """Precomposed syllables, one per cell."""
+
+    name = "hangul"
+
+    def __init__(self) -> None:
+        symbols = encode_word(COMMON_SYLLABLES)
+        super().__init__(symbols, 1 / np.arange(1, symbols.size + 1))
+
+    def normalize(self, word: str) -> str:
+        codes = _hangul_codes(word)
+        if not _is_syllable(codes).all():
+            raise ValueError(f"not a Hangul word: {word}")
+        return decode_cells(codes)
+
+
+class HangulJamoAlphabet(Alphabet):
+    """Words decomposed into jamo, one jamo per cell."""
+
+    name = "jamo"
+
+    def __init__(self, syllables: HangulSyllableAlphabet) -> None:
+        # Jamo filler follows the jamo frequencies of the syllable table.
+        weights = np.repeat(np.diff(syllables._cumulative, prepend=0.0), 3)
+        slots = _jamo_slots(syllables.symbols).ravel()
+        used = slots != 0
+        symbols, inverse = np.unique(slots[used], return_inverse=True)
+        super().__init__(symbols, np.bincount(inverse, weights=weights[used]))
+
+    def normalize(self, word: str) -> str:
+        codes = _hangul_codes(word)
+        if not (_is_syllable(codes) | _is_compat_jamo(codes)).all():
+            raise ValueError(f"not a Hangul word: {word}")
+        return decode_cells(decompose(codes))
+
+
+_HANGUL = HangulSyllableAlphabet()
+ALPHABETS: dict[str, Alphabet] = {
+    "latin": LatinAlphabet(),
+    "hangul": _HANGUL,
+    "jamo": HangulJamoAlphabet(_HANGUL),
+}
+
+
+def detect_alphabet(text: str) -> Alphabet:
+    """Guess the alphabet a finished grid was generated with."""
+    codes = encode_word(text)
+    if _is_syllable(codes).any():
+        return ALPHABETS["hangul"]
+    if _is_compat_jamo(codes).any():
+        return ALPHABETS["jamo"]
+    return ALPHABETS["latin"]
@@ -0,0 +1,61 @@
+"""Aho-Corasick multi-pattern matcher over code point sequences."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator, Sequence
+
+
+class Automaton:
+    """Finds every occurrence of every pattern in one left-to-right pass.
+
+    Patterns and inputs are sequences of integers (code points), so the
+    matcher runs directly on rows of the grid buffer.
+    """
+
+    def __init__(self, patterns: Iterable[Sequence[int]]) -> None:
+        self.patterns: list[tuple[int, ...]] = []
+        self._goto: list[dict[int, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for pattern in patterns:
+            self._add(tuple(pattern))
+        self._link()
+
+    def _add(self, pattern: tuple[int, ...]) -> None:
+        state = 0
+        for symbol in pattern:
+            nxt = self._goto[state].get(symbol)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][symbol] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] += (len(self.patterns),)
+        self.patterns.append(pattern)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(symbol, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def iter_matches(self, sequence: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """Yield ``(end_position, pattern_index)`` for every match."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, symbol in enumerate(sequence):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for pattern in out[state]:
+                yield position, pattern
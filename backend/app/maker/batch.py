@@ -0,0 +1,52 @@
+"""Process pool used to generate puzzles off the event loop."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ..config import settings
+from .errors import PlacementError
+from .maker import Maker
+from .shapes import mask_from_bitmap
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Return the shared generation pool, starting it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.maker_workers or os.cpu_count())
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def generate_puzzle(spec: dict) -> dict:
+    """Build one puzzle from a :class:`~app.schemas.MakerSpec` dump.
+
+    Runs inside a worker process, so it takes and returns plain data.
+    """
+    try:
+        puzzle = Maker(
+            spec["words"],
+            spec["size"],
+            directions=spec["directions"],
+            seed=spec.get("seed"),
+            strategy=spec.get("strategy", "random"),
+            time_budget=spec["time_budget_ms"] / 1000 if spec.get("time_budget_ms") else None,
+            alphabet=spec.get("alphabet", "latin"),
+            shape=spec.get("shape"),
+            mask=mask_from_bitmap(spec["shape_bitmap"]) if spec.get("shape_bitmap") else None,
+            message=spec.get("message"),
+            neighbors=spec.get("neighbors", 8),
+        ).generate()
+    except (PlacementError, ValueError) as exc:
+        return {"title": spec.get("title"), "error": str(exc)}
+    return {"title": spec.get("title"), **puzzle.to_dict()}
@@ -0,0 +1,111 @@
+"""Content-addressed cache of generated puzzles.
+
+A spec with a seed is deterministic, so its normalized form (words, size,
+direction set, seed, strategy, time budget, alphabet, shape and hidden
+message) is hashed into a key and the generated payload is reused.
+Partial layouts cut short by a time budget are never stored.  Lookups go
+through a bounded in-memory LRU first and the ``puzzle_cache`` table
+second; disk hits are promoted back into memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import PuzzleCacheEntry
+from .alphabet import ALPHABETS
+from .grid import DIRECTION_NAMES
+
+
+def spec_key(spec: dict) -> str | None:
+    """Hash of the normalized spec, or ``None`` when it has no seed."""
+    if spec.get("seed") is None:
+        return None
+    alphabet = spec.get("alphabet", "latin")
+    normalized = {
+        "alphabet": alphabet,
+        "words": sorted({ALPHABETS[alphabet].normalize(w) for w in spec["words"]}),
+        "size": spec["size"],
+        "directions": [d for d in DIRECTION_NAMES if d in spec["directions"]],
+        "seed": spec["seed"],
+        "strategy": spec.get("strategy", "random"),
+        "time_budget_ms": spec.get("time_budget_ms"),
+    }
+    if normalized["strategy"] == "snake":
+        normalized["neighbors"] = spec.get("neighbors", 8)
+    # Only some specs carry these, so keys of plain specs stay unchanged.
+    for name in ("shape", "shape_bitmap", "message"):
+        if spec.get(name) is not None:
+            normalized[name] = spec[name]
+    encoded = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class PuzzleCache:
+    def __init__(
+        self, maxsize: int, session_factory: Callable[[], Session] = SessionLocal
+    ) -> None:
+        self.maxsize = maxsize
+        self._session_factory = session_factory
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return payload
+        with self._session_factory() as db:
+            entry = db.get(PuzzleCacheEntry, key)
+            payload = json.loads(entry.payload) if entry is not None else None
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, payload)
+        return payload
+
+    def put(self, key: str, payload: dict) -> None:
+        with self._lock:
+            self._remember(key, payload)
+        with self._session_factory() as db:
+            db.add(PuzzleCacheEntry(key=key, payload=json.dumps(payload, ensure_ascii=False)))
+            try:
+                db.commit()
+            except IntegrityError:
+                # Another request generated the same spec concurrently.
+                db.rollback()
+
+    def _remember(self, key: str, payload: dict) -> None:
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_size": len(self._memory),
+                "memory_maxsize": self.maxsize,
+            }
+
+
+puzzle_cache = PuzzleCache(settings.maker_cache_size)
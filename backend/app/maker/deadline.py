@@ -0,0 +1,19 @@
+"""Wall-clock budget for anytime generation."""
+
+from __future__ import annotations
+
+import time
+
+
+class Deadline:
+    """A point in time, ``seconds`` from construction, on the monotonic clock."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self._end = time.monotonic() + seconds
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self._end
+
+    def remaining(self) -> float:
+        return max(0.0, self._end - time.monotonic())
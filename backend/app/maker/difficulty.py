@@ -0,0 +1,91 @@
+"""Difficulty score of a generated puzzle, computed once at generation time."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Sequence
+
+import numpy as np
+
+from .grid import BLOCKED, DIRECTION_NAMES, DIRECTIONS, EMPTY, Grid, Placement
+
+# Directions read against the usual left-to-right, top-to-bottom habit.
+BACKWARD_DIRECTIONS = frozenset(
+    name for name, (dr, dc) in DIRECTIONS.items() if dc < 0 or (dc == 0 and dr < 0)
+)
+
+WEIGHTS = {
+    "direction_mix": 0.35,
+    "reversed": 0.25,
+    "overlap": 0.15,
+    "camouflage": 0.25,
+}
+
+
+_STEP_DIRECTIONS = {delta: name for name, delta in DIRECTIONS.items()}
+
+
+def _reading_directions(p: Placement, cols: int) -> list[tuple[str, float]]:
+    if p.direction in DIRECTIONS:
+        return [(p.direction, 1.0)]
+    cells = p.indices(cols)
+    if cells.size < 2:
+        return [(DIRECTION_NAMES[0], 1.0)]
+    rows, columns = np.divmod(cells, cols)
+    steps = zip(np.diff(rows).tolist(), np.diff(columns).tolist())
+    share = 1 / (cells.size - 1)
+    return [(_STEP_DIRECTIONS[step], share) for step in steps]
+
+
+def difficulty_components(grid: Grid, placements: Sequence[Placement]) -> dict[str, float]:
+    """Each factor in ``[0, 1]``, higher meaning harder.
+
+    * ``direction_mix``: entropy of the directions used, over log(8).  A
+      snaking word counts each of its steps, weighted to one word in total.
+    * ``reversed``: share of words read backwards.
+    * ``overlap``: share of word letters sitting on a cell used by another word.
+    * ``camouflage``: how closely the filler letter distribution matches that
+      of the words (1 - total variation distance); filler that looks like
+      the words hides them better.
+    """
+    if not placements:
+        return dict.fromkeys(WEIGHTS, 0.0)
+    directions: Counter[str] = Counter()
+    for p in placements:
+        for name, share in _reading_directions(p, grid.cols):
+            directions[name] += share
+    total = len(placements)
+    entropy = -sum(n / total * math.log(n / total) for n in directions.values())
+
+    covered = np.zeros(grid.cells.size, dtype=bool)
+    letters = 0
+    for p in placements:
+        covered[p.indices(grid.cols)] = True
+        letters += p.length
+    overlap = 1 - covered.sum() / letters
+
+    word_cells = grid.cells[covered]
+    filler_cells = grid.cells[~covered & (grid.cells != EMPTY) & (grid.cells != BLOCKED)]
+    camouflage = 0.0
+    if filler_cells.size:
+        cells = np.concatenate([word_cells, filler_cells])
+        symbols, inverse = np.unique(cells, return_inverse=True)
+        word_hist = np.bincount(inverse[: word_cells.size], minlength=symbols.size)
+        filler_hist = np.bincount(inverse[word_cells.size :], minlength=symbols.size)
+        word_share = word_hist / word_cells.size
+        filler_share = filler_hist / filler_cells.size
+        camouflage = 1 - 0.5 * float(np.abs(word_share - filler_share).sum())
+
+    return {
+        "direction_mix": entropy / math.log(len(DIRECTIONS)),
+        "reversed": sum(n for d, n in directions.items() if d in BACKWARD_DIRECTIONS) / total,
+        "overlap": float(overlap),
+        "camouflage": camouflage,
+    }
+
+
+def difficulty_score(grid: Grid, placements: Sequence[Placement]) -> float:
+    """Weighted sum of :func:`difficulty_components`, scaled to 0-100."""
+    components = difficulty_components(grid, placements)
+    return round(100 * sum(WEIGHTS[name] * value for name, value in components.items()), 1)
@@ -0,0 +1,13 @@
+"""Exceptions raised by the Maker."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+
+class PlacementError(Exception):
+    """Raised when the Maker cannot fit every word into the grid."""
+
+    def __init__(self, message: str, unplaced: Sequence[str] = ()) -> None:
+        super().__init__(message)
+        self.unplaced = list(unplaced)
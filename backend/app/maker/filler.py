@@ -0,0 +1,66 @@
+"""Filler stage: fill empty cells without spelling a target word twice."""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .errors import PlacementError
+from .grid import EMPTY, Grid, Placement
+from .scan import WordScanner, grid_lines, lines_by_cell
+
+# Draws ``n`` filler code points.
+Sampler = Callable[[int], np.ndarray]
+
+
+def fill_without_duplicates(
+    grid: Grid,
+    placements: Sequence[Placement],
+    sample: Sampler,
+    max_rounds: int = 100,
+    scanner: WordScanner | None = None,
+    keep: np.ndarray | None = None,
+) -> None:
+    """Fill every empty cell so that each word occurs only where it was placed.
+
+    After a random fill, all lines are scanned once with an Aho-Corasick
+    automaton over the words and their reverses.  Any occurrence that is not
+    one of ``placements`` has its filler cells re-rolled, and only the lines
+    through re-rolled cells are scanned again, so the work stays linear in
+    the grid size.  Occurrences made purely of placed letters (say a word
+    contained in a longer one) cannot be changed by filler and are accepted.
+
+    ``scanner`` defaults to one over the placed words; pass a wider one to
+    also keep words placed elsewhere out of this grid.  ``keep`` is a
+    board-sized array of filler letters to reuse where possible (``EMPTY``
+    where a fresh letter should be drawn); kept letters are still re-rolled
+    if they spell a word.
+    """
+    free = np.flatnonzero(grid.cells == EMPTY)
+    if free.size == 0:
+        return
+    filler = np.zeros(grid.cells.size, dtype=bool)
+    filler[free] = True
+    letters = keep[free] if keep is not None else np.zeros(free.size, dtype=np.uint32)
+    fresh = letters == EMPTY
+    letters[fresh] = sample(int(fresh.sum()))
+    grid.fill(free, letters)
+
+    expected = {(p.word, frozenset(p.indices(grid.cols).tolist())) for p in placements}
+    if scanner is None:
+        scanner = WordScanner(p.word for p in placements)
+    lines = grid_lines(grid.rows, grid.cols)
+    pending = list(lines)
+    for _ in range(max_rounds):
+        reroll = set()
+        for occurrence in scanner.scan(grid.cells, grid.cols, pending):
+            if (occurrence.word, occurrence.cells) not in expected:
+                reroll.update(i for i in occurrence.indices if filler[i])
+        if not reroll:
+            return
+        cells = np.fromiter(reroll, dtype=np.intp)
+        grid.fill(cells, sample(cells.size))
+        touched = np.unique(lines_by_cell(grid.rows, grid.cols)[cells])
+        pending = [lines[i] for i in touched]
+    raise PlacementError(f"filler still repeats a word after {max_rounds} rounds")
@@ -0,0 +1,228 @@
+"""Array-backed word search grid.
+
+The board is a flat ``uint32`` buffer of code points, with ``EMPTY`` (0)
+marking cells that no word has claimed yet.  Conflict checks for a word are
+evaluated for every start cell of a direction at once by comparing shifted
+views of the board, so the Python-level loop is over directions and letters
+rather than over cells.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+EMPTY = 0
+# Cells outside a shaped grid; renders as a blank and never matches a letter.
+BLOCKED = ord(" ")
+
+DIRECTIONS: dict[str, tuple[int, int]] = {
+    "right": (0, 1),
+    "down": (1, 0),
+    "down_right": (1, 1),
+    "up_right": (-1, 1),
+    "left": (0, -1),
+    "up": (-1, 0),
+    "up_left": (-1, -1),
+    "down_left": (1, -1),
+}
+DIRECTION_NAMES: tuple[str, ...] = tuple(DIRECTIONS)
+
+
+def encode_word(word: str) -> np.ndarray:
+    """Return the code points of ``word`` as a ``uint32`` array."""
+    return np.frombuffer(word.encode("utf-32-le"), dtype=np.uint32)
+
+
+def decode_cells(cells: np.ndarray) -> str:
+    """Inverse of :func:`encode_word`; empty and blocked cells become spaces."""
+    cells = np.where(cells == EMPTY, ord(" "), cells).astype("<u4")
+    return cells.tobytes().decode("utf-32-le")
+
+
+def _start_span(size: int, step: int, length: int) -> tuple[int, int]:
+    """Half-open range of start indices that keep ``length`` cells in bounds."""
+    if step > 0:
+        return 0, size - length + 1
+    if step < 0:
+        return length - 1, size
+    return 0, size
+
+
+def run_lengths(mask: np.ndarray, direction: str) -> np.ndarray:
+    """Usable cells in a row from each cell along ``direction``, edge included.
+
+    Computed with one vectorized step per row (or column, for horizontal
+    directions), sweeping against the direction so each cell extends the
+    run of its successor.
+    """
+    dr, dc = DIRECTIONS[direction]
+    rows, cols = mask.shape
+    usable = mask.astype(np.int32)
+    runs = np.zeros((rows, cols), dtype=np.int32)
+    if dr == 0:
+        for c in (range(cols - 1, -1, -1) if dc > 0 else range(cols)):
+            following = runs[:, c + dc] if 0 <= c + dc < cols else 0
+            runs[:, c] = usable[:, c] * (1 + following)
+        return runs
+    for r in (range(rows - 1, -1, -1) if dr > 0 else range(rows)):
+        following = np.zeros(cols, dtype=np.int32)
+        if 0 <= r + dr < rows:
+            if dc == 0:
+                following = runs[r + dr]
+            elif dc > 0:
+                following[:-1] = runs[r + dr, 1:]
+            else:
+                following[1:] = runs[r + dr, :-1]
+        runs[r] = usable[r] * (1 + following)
+    return runs
+
+
+@dataclass(frozen=True)
+class Placement:
+    """A word laid out in a straight line from ``(row, col)``."""
+
+    word: str
+    row: int
+    col: int
+    direction: str
+
+    @property
+    def length(self) -> int:
+        return len(self.word)
+
+    def coordinates(self) -> list[tuple[int, int]]:
+        dr, dc = DIRECTIONS[self.direction]
+        return [(self.row + dr * k, self.col + dc * k) for k in range(self.length)]
+
+    def indices(self, cols: int) -> np.ndarray:
+        """Flat board indices covered by the word, in reading order."""
+        dr, dc = DIRECTIONS[self.direction]
+        start = self.row * cols + self.col
+        return start + np.arange(self.length) * (dr * cols + dc)
+
+
+class Grid:
+    """A ``rows`` x ``cols`` board stored as a flat code point buffer.
+
+    ``mask`` optionally marks the usable cells of a shaped grid; the rest
+    hold ``BLOCKED`` and are skipped when enumerating candidate starts.
+    Letters written before :meth:`freeze` survive :meth:`reset`.
+    """
+
+    def __init__(self, rows: int, cols: int, mask: np.ndarray | None = None) -> None:
+        if rows <= 0 or cols <= 0:
+            raise ValueError("grid dimensions must be positive")
+        if mask is not None and mask.shape != (rows, cols):
+            raise ValueError("shape mask does not match the grid size")
+        self.rows = rows
+        self.cols = cols
+        self.mask = mask
+        self._runs: dict[str, np.ndarray] = {}
+        self._frozen: np.ndarray | None = None
+        self.cells = np.zeros(rows * cols, dtype=np.uint32)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every usable cell that was not frozen."""
+        if self._frozen is not None:
+            self.cells[:] = self._frozen
+            return
+        self.cells[:] = EMPTY
+        if self.mask is not None:
+            self.cells[~self.mask.ravel()] = BLOCKED
+
+    def freeze(self) -> None:
+        """Make the current contents the state :meth:`reset` returns to."""
+        self._frozen = self.cells.copy()
+
+    def run_lengths(self, direction: str) -> np.ndarray | None:
+        """Usable cells in a row from each start along ``direction`` (shaped grids)."""
+        if self.mask is None:
+            return None
+        if direction not in self._runs:
+            self._runs[direction] = run_lengths(self.mask, direction)
+        return self._runs[direction]
+
+    @property
+    def board(self) -> np.ndarray:
+        """2-D view of :attr:`cells`; writes go through to the buffer."""
+        return self.cells.reshape(self.rows, self.cols)
+
+    def candidates(self, codes: np.ndarray, directions: Sequence[str]) -> np.ndarray:
+        """Boolean mask of legal start cells, shaped ``(len(directions), rows, cols)``.
+
+        A start is legal when every cell the word would cover is in bounds and
+        either empty or already holds the same letter.
+        """
+        return self._scan(codes, directions, count_shared=False)[0]
+
+    def scored_candidates(
+        self, codes: np.ndarray, directions: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Like :meth:`candidates`, plus the letters each start shares with the board."""
+        return self._scan(codes, directions, count_shared=True)
+
+    def _scan(
+        self, codes: np.ndarray, directions: Sequence[str], count_shared: bool
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        board = self.board
+        length = len(codes)
+        shape = (len(directions), self.rows, self.cols)
+        mask = np.zeros(shape, dtype=bool)
+        shared = np.zeros(shape, dtype=np.int16) if count_shared else None
+        for d, name in enumerate(directions):
+            dr, dc = DIRECTIONS[name]
+            r0, r1 = _start_span(self.rows, dr, length)
+            c0, c1 = _start_span(self.cols, dc, length)
+            if r0 >= r1 or c0 >= c1:
+                continue
+            runs = self.run_lengths(name)
+            if runs is None:
+                ok = np.ones((r1 - r0, c1 - c0), dtype=bool)
+            else:
+                ok = runs[r0:r1, c0:c1] >= length
+                if not ok.any():
+                    continue
+            for k, code in enumerate(codes):
+                window = board[r0 + dr * k : r1 + dr * k, c0 + dc * k : c1 + dc * k]
+                same = window == code
+                ok &= (window == EMPTY) | same
+                if shared is not None:
+                    shared[d, r0:r1, c0:c1] += same
+            mask[d, r0:r1, c0:c1] = ok
+        return mask, shared
+
+    def place(self, placement: Placement, codes: np.ndarray) -> np.ndarray:
+        """Write ``codes`` along ``placement``; return the indices newly claimed."""
+        indices = placement.indices(self.cols)
+        fresh = indices[self.cells[indices] == EMPTY]
+        self.cells[indices] = codes
+        return fresh
+
+    def clear(self, indices: np.ndarray) -> None:
+        self.cells[indices] = EMPTY
+
+    def empty_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.cells == EMPTY)
+
+    def fill(self, indices: np.ndarray, codes: np.ndarray) -> None:
+        self.cells[indices] = codes
+
+    def to_rows(self) -> list[str]:
+        return [decode_cells(row) for row in self.board]
+
+
+def placements_from_mask(
+    word: str, mask: np.ndarray, directions: Sequence[str], flat: Iterable[int]
+) -> list[Placement]:
+    """Turn flat indices into ``mask`` back into :class:`Placement` objects."""
+    _, rows, cols = mask.shape
+    placements = []
+    for index in flat:
+        d, rest = divmod(int(index), rows * cols)
+        row, col = divmod(rest, cols)
+        placements.append(Placement(word, row, col, directions[d]))
+    return placements
@@ -0,0 +1,286 @@
+"""Word Search Maker: turns a word list into a filled puzzle grid."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+from .alphabet import ALPHABETS
+from .deadline import Deadline
+from .difficulty import difficulty_score
+from .errors import PlacementError
+from .filler import fill_without_duplicates
+from .grid import DIRECTION_NAMES, DIRECTIONS, Grid, Placement, encode_word
+from .paths import NEIGHBORHOODS, PathPlacement, SnakePlacer
+from .placer import MAX_NODES, PLACERS, BacktrackingPlacer, CompactPlacer, RandomPlacer
+from .positions import encode_position
+from .scan import WordScanner, grid_lines
+from .shapes import SHAPES, pack_mask
+
+STRATEGIES = (*PLACERS, "snake")
+
+
+def _normalize_size(size: int | tuple[int, int]) -> tuple[int, int]:
+    if isinstance(size, int):
+        return size, size
+    rows, cols = size
+    return int(rows), int(cols)
+
+
+@dataclass
+class Puzzle:
+    """A generated grid together with the placement of every word."""
+
+    grid: Grid
+    placements: list[Placement | PathPlacement]
+    seed: int | None = None
+    unplaced: list[str] = field(default_factory=list)
+    message: str | None = None
+
+    @property
+    def difficulty(self) -> float:
+        return difficulty_score(self.grid, self.placements)
+
+    @property
+    def rows(self) -> int:
+        return self.grid.rows
+
+    @property
+    def cols(self) -> int:
+        return self.grid.cols
+
+    def to_rows(self) -> list[str]:
+        return self.grid.to_rows()
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "cols": self.cols,
+            "grid": self.to_rows(),
+            "seed": self.seed,
+            "difficulty": self.difficulty,
+            "words": [
+                {
+                    "word": p.word,
+                    "row": p.row,
+                    "col": p.col,
+                    "direction": p.direction,
+                    **self._position(p),
+                }
+                for p in self.placements
+            ],
+            "unplaced": list(self.unplaced),
+            **({"mask": pack_mask(self.grid.mask)} if self.grid.mask is not None else {}),
+            **({"message": self.message} if self.message is not None else {}),
+        }
+
+    @staticmethod
+    def _position(p: Placement | PathPlacement) -> dict:
+        if isinstance(p, PathPlacement):
+            return {"position_data": None, "path": list(p.cells)}
+        return {"position_data": encode_position(p.row, p.col, p.direction, p.length)}
+
+
+class Maker:
+    """Generate a word search puzzle.
+
+    ``strategy`` selects the placer:
+
+    * ``"random"`` places words longest first, each at a random legal start
+      found with one vectorized pass over the board, and rebuilds the grid
+      (up to ``max_attempts`` times) when a word has no room left.
+    * ``"backtrack"`` runs a most-constrained-first backtracking search
+      bounded by ``max_nodes``; use it for dense word lists.
+    * ``"compact"`` looks for the smallest square grid, up to ``size``, in
+      which the words fit when each goes to its highest-overlap start.
+    * ``"snake"`` lays words along bending paths through ``neighbors`` (4 or
+      8) adjacent cells; ``directions`` does not apply.
+
+    With ``time_budget`` (seconds) generation is anytime: when the budget
+    runs out the best layout found so far is filled and returned, and the
+    words left out are listed in :attr:`Puzzle.unplaced` instead of raising
+    :class:`PlacementError`.
+
+    ``alphabet`` is a key of :data:`~app.maker.alphabet.ALPHABETS`: ``"latin"``,
+    ``"hangul"`` (one precomposed syllable per cell) or ``"jamo"`` (words
+    decomposed into jamo, one per cell).
+
+    ``shape`` names a key of :data:`~app.maker.shapes.SHAPES`, drawn to fit
+    the grid; ``mask`` is an explicit ``(rows, cols)`` boolean layout.  Cells
+    outside either are left blank and never hold a letter.
+
+    ``message`` turns on hidden-message mode: the cells no word covers, read
+    row by row, spell the message (letters only, normalized like the words)
+    instead of holding random filler.  Placement then runs the backtracking
+    search with exactly that many cells reserved, retried while the message
+    spells one of the words a second time.
+    """
+
+    def __init__(
+        self,
+        words: Sequence[str],
+        size: int | tuple[int, int],
+        directions: Sequence[str] = DIRECTION_NAMES,
+        seed: int | None = None,
+        strategy: str = "random",
+        max_attempts: int = 20,
+        max_nodes: int = MAX_NODES,
+        time_budget: float | None = None,
+        alphabet: str = "latin",
+        shape: str | None = None,
+        mask: np.ndarray | None = None,
+        message: str | None = None,
+        neighbors: int = 8,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {strategy}")
+        if neighbors not in NEIGHBORHOODS:
+            raise ValueError(f"neighbors must be one of {sorted(NEIGHBORHOODS)}")
+        if alphabet not in ALPHABETS:
+            raise ValueError(f"unknown alphabet: {alphabet}")
+        if shape is not None and shape not in SHAPES:
+            raise ValueError(f"unknown shape: {shape}")
+        if shape is not None and mask is not None:
+            raise ValueError("give either a shape or a mask, not both")
+        self.alphabet = ALPHABETS[alphabet]
+        self.rows, self.cols = _normalize_size(size)
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self.rows, self.cols):
+                raise ValueError("shape mask does not match the grid size")
+            if strategy == "compact":
+                raise ValueError("the compact strategy cannot shrink a custom mask")
+        self.shape = shape
+        self.mask = mask
+        self.message = None
+        if message is not None:
+            if strategy in ("compact", "snake"):
+                raise ValueError(f"the {strategy} strategy cannot reserve cells for a message")
+            self.message = self.alphabet.normalize("".join(ch for ch in message if ch.isalpha()))
+            if not self.message:
+                raise ValueError("the message has no letters")
+        self.strategy = strategy
+        self.words = self._prepare_words(words)
+        unknown = [d for d in directions if d not in DIRECTIONS]
+        if unknown:
+            raise ValueError(f"unknown directions: {', '.join(unknown)}")
+        if not directions:
+            raise ValueError("at least one direction is required")
+        # Canonical order, so the same direction set always lays out the same way.
+        self.directions = tuple(d for d in DIRECTION_NAMES if d in directions)
+        self.seed = seed
+        self.neighbors = neighbors
+        self.max_attempts = max_attempts
+        self.max_nodes = max_nodes
+        self.time_budget = time_budget
+        self.rng = np.random.default_rng(seed)
+
+    def _prepare_words(self, words: Sequence[str]) -> list[str]:
+        prepared = [self.alphabet.normalize(w) for w in words]
+        if not all(prepared):
+            raise ValueError("words must not be empty")
+        # A bending path can use every cell; a straight word one line at most.
+        longest = self.rows * self.cols if self.strategy == "snake" else max(self.rows, self.cols)
+        too_long = [w for w in prepared if len(w) > longest]
+        if too_long:
+            raise ValueError(f"words longer than the grid: {', '.join(too_long)}")
+        # Order-independent: the same set of words always lays out the same way.
+        return sorted(dict.fromkeys(prepared), key=lambda w: (-len(w), w))
+
+    def generate(self) -> Puzzle:
+        deadline = Deadline(self.time_budget) if self.time_budget is not None else None
+        if self.strategy == "compact":
+            grid, placements = self._place_compact(deadline)
+        elif self.message is not None:
+            grid, placements = self._place_around_message(deadline)
+        else:
+            grid = self._new_grid(self.rows, self.cols)
+            placements = self._placer().place(grid, self.words, deadline)
+        if self.message is None:
+            self.fill(grid, placements)
+        placed = {p.word for p in placements}
+        unplaced = [w for w in self.words if w not in placed]
+        return Puzzle(grid, placements, seed=self.seed, unplaced=unplaced, message=self.message)
+
+    def _place_compact(self, deadline: Deadline | None) -> tuple[Grid, list[Placement]]:
+        """Grow a square grid from the smallest plausible side until the words fit."""
+        longest = len(self.words[0])
+        letters = sum(len(w) for w in self.words)
+        # Even heavily overlapped words rarely share more than half their letters.
+        smallest = max(longest, math.isqrt(letters // 2))
+        placer = CompactPlacer(self.directions, self.rng)
+        best: tuple[Grid, list[Placement]] | None = None
+        for side in range(smallest, max(self.rows, self.cols) + 1):
+            grid = self._new_grid(side, side)
+            try:
+                placements = placer.place(grid, self.words, deadline)
+            except PlacementError:
+                continue
+            if len(placements) == len(self.words):
+                return grid, placements
+            if best is None or len(placements) > len(best[1]):
+                best = grid, placements
+            if deadline is not None and deadline.expired():
+                break
+        if best is not None:
+            return best
+        raise PlacementError(
+            f"could not pack the words into a grid of at most {self.rows}x{self.cols}"
+        )
+
+    def _new_grid(self, rows: int, cols: int) -> Grid:
+        if self.shape is not None:
+            return Grid(rows, cols, SHAPES[self.shape](rows, cols))
+        return Grid(rows, cols, self.mask)
+
+    def _placer(self) -> RandomPlacer | BacktrackingPlacer | SnakePlacer:
+        if self.strategy == "snake":
+            return SnakePlacer(self.neighbors, self.rng, max_attempts=self.max_attempts)
+        if self.message is not None:
+            return BacktrackingPlacer(
+                self.directions, self.rng, max_nodes=self.max_nodes, reserve=len(self.message)
+            )
+        if self.strategy == "backtrack":
+            return BacktrackingPlacer(self.directions, self.rng, max_nodes=self.max_nodes)
+        return RandomPlacer(self.directions, self.rng, max_attempts=self.max_attempts)
+
+    def _place_around_message(self, deadline: Deadline | None) -> tuple[Grid, list[Placement]]:
+        """Lay out the words, then spell the message in the cells left over.
+
+        The message cannot be re-rolled like filler, so a layout where it
+        spells a word a second time is thrown away and the search run again,
+        up to ``max_attempts`` times.
+        """
+        scanner = WordScanner(self.words)
+        for _ in range(self.max_attempts):
+            grid = self._new_grid(self.rows, self.cols)
+            placements = self._placer().place(grid, self.words, deadline)
+            free = self._write_message(grid)
+            expected = {(p.word, frozenset(p.indices(grid.cols).tolist())) for p in placements}
+            message = frozenset(free.tolist())
+            if not any(
+                (o.word, o.cells) not in expected and o.cells & message
+                for o in scanner.scan(grid.cells, grid.cols, grid_lines(grid.rows, grid.cols))
+            ):
+                return grid, placements
+            if deadline is not None and deadline.expired():
+                break
+        raise PlacementError("the message spells a word a second time in every layout tried")
+
+    def _write_message(self, grid: Grid) -> np.ndarray:
+        """Spell the message in the uncovered cells, in reading order; return them."""
+        free = grid.empty_indices()
+        if free.size != len(self.message):
+            raise PlacementError(
+                f"the layout leaves {free.size} free cells, "
+                f"the message needs exactly {len(self.message)}"
+            )
+        grid.fill(free, encode_word(self.message))
+        return free
+
+    def fill(self, grid: Grid, placements: Sequence[Placement]) -> None:
+        """Fill empty cells with random letters that spell no word a second time."""
+        fill_without_duplicates(grid, placements, self.alphabet.sampler(self.rng))
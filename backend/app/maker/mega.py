@@ -0,0 +1,90 @@
+"""Very large grids generated band by band with a bounded working set.
+
+The grid is produced in horizontal bands of ``band_height`` rows.  Each band
+is laid out on its own small :class:`Grid` together with the last few rows
+of the previous band as read-only context, so words may cross the seam and
+the duplicate check sees every line that passes through the new cells.
+Rows are yielded as soon as their band is filled; memory use depends on the
+band size and the grid width, never on the total number of rows.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from .alphabet import ALPHABETS
+from .deadline import Deadline
+from .filler import fill_without_duplicates
+from .grid import DIRECTION_NAMES, Grid, Placement
+from .placer import RandomPlacer
+from .scan import WordScanner
+
+BAND_HEIGHT = 64
+MAX_SIDE = 2000
+# Placement time per band before leftover words move on to the next band.
+BAND_TIME_BUDGET = 1.0
+
+
+def generate_bands(
+    words: Sequence[str],
+    rows: int,
+    cols: int,
+    directions: Sequence[str] = DIRECTION_NAMES,
+    seed: int | None = None,
+    band_height: int = BAND_HEIGHT,
+    alphabet: str = "latin",
+) -> Iterator[dict]:
+    """Yield ``{"start", "rows", "words"}`` per band, then ``{"unplaced"}``.
+
+    ``rows`` are the finished grid rows of the band starting at row
+    ``start``; ``words`` are the placements, in whole-grid coordinates, made
+    while laying out the band (a word may start in the previous band's rows).
+    Words that found no room are carried over to the next band and any left
+    at the end are reported as ``unplaced``.
+    """
+    if not (0 < rows <= MAX_SIDE and 0 < cols <= MAX_SIDE):
+        raise ValueError(f"grid sides must be between 1 and {MAX_SIDE}")
+    letters = ALPHABETS[alphabet]
+    prepared = sorted(
+        dict.fromkeys(w for w in (letters.normalize(w) for w in words) if w),
+        key=lambda w: (-len(w), w),
+    )
+    longest = max((len(w) for w in prepared), default=1)
+    if longest > max(rows, cols):
+        raise ValueError("words longer than the grid")
+    band_height = min(rows, max(band_height, longest))
+    context_height = longest - 1
+    directions = tuple(d for d in DIRECTION_NAMES if d in directions)
+    rng = np.random.default_rng(seed)
+    sample = letters.sampler(rng)
+    # Every band guards against all words, wherever they end up being placed.
+    scanner = WordScanner(prepared)
+    starts = range(0, rows, band_height)
+    queues = [prepared[i :: len(starts)] for i in range(len(starts))]
+    context = np.empty((0, cols), dtype=np.uint32)
+    carried: list[str] = []
+    for band, start in enumerate(starts):
+        height = min(band_height, rows - start)
+        offset = context.shape[0]
+        grid = Grid(offset + height, cols)
+        grid.board[:offset] = context
+        # Context rows were already streamed; retries must not overwrite them.
+        grid.freeze()
+        band_words = carried + queues[band]
+        placements = RandomPlacer(directions, rng).place(
+            grid, band_words, Deadline(BAND_TIME_BUDGET)
+        )
+        fill_without_duplicates(grid, placements, sample, scanner=scanner)
+        placed = {p.word for p in placements}
+        carried = [w for w in band_words if w not in placed]
+        yield {
+            "start": start,
+            "rows": grid.to_rows()[offset:],
+            "words": [
+                Placement(p.word, p.row - offset + start, p.col, p.direction) for p in placements
+            ],
+        }
+        context = grid.board[max(0, grid.rows - context_height) :].copy()
+    yield {"unplaced": carried}
@@ -0,0 +1,152 @@
+"""Snaking placement: words that bend along 4- or 8-neighbour paths.
+
+A path word is a self-avoiding walk over grid cells, one letter per step.
+Neighbours come from an adjacency table built once per grid size, so the
+search only ever indexes arrays.  Each step is checked against a per-word
+availability mask (cells empty or already holding that letter) and a
+one-step lookahead: a cell is entered only if the next letter still has
+somewhere to go from it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+from .grid import EMPTY, Grid
+from .placer import _GreedyPlacer, constraint_order
+
+PATH_DIRECTION = "path"
+
+NEIGHBORHOODS: dict[int, tuple[tuple[int, int], ...]] = {
+    4: ((0, 1), (1, 0), (0, -1), (-1, 0)),
+    8: ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, 1), (1, -1), (-1, -1)),
+}
+
+
+@lru_cache(maxsize=64)
+def adjacency(rows: int, cols: int, neighbors: int) -> np.ndarray:
+    """``(rows * cols, neighbors)`` flat neighbour indices, ``-1`` off the board."""
+    r, c = np.divmod(np.arange(rows * cols), cols)
+    table = np.full((rows * cols, neighbors), -1, dtype=np.intp)
+    for k, (dr, dc) in enumerate(NEIGHBORHOODS[neighbors]):
+        nr, nc = r + dr, c + dc
+        inside = (nr >= 0) & (nr < rows) & (nc >= 0) & (nc < cols)
+        table[inside, k] = nr[inside] * cols + nc[inside]
+    table.flags.writeable = False
+    return table
+
+
+@dataclass(frozen=True)
+class PathPlacement:
+    """A word laid out along ``cells``, flat board indices in reading order."""
+
+    word: str
+    cells: tuple[int, ...]
+    cols: int
+    direction = PATH_DIRECTION
+
+    @property
+    def length(self) -> int:
+        return len(self.word)
+
+    @property
+    def row(self) -> int:
+        return self.cells[0] // self.cols
+
+    @property
+    def col(self) -> int:
+        return self.cells[0] % self.cols
+
+    def coordinates(self) -> list[tuple[int, int]]:
+        return [divmod(cell, self.cols) for cell in self.cells]
+
+    def indices(self, cols: int) -> np.ndarray:
+        return np.asarray(self.cells, dtype=np.intp)
+
+
+def encode_path(cells: Sequence[int]) -> str:
+    """Storage form of a path: comma-separated flat cell indices."""
+    return ",".join(map(str, cells))
+
+
+def decode_path(text: str) -> tuple[int, ...]:
+    return tuple(int(cell) for cell in text.split(","))
+
+
+class SnakePlacer(_GreedyPlacer):
+    """Place each word along a random self-avoiding path.
+
+    Starts are tried in random order and each path search is a depth-first
+    walk that prefers cells already holding the next letter; one search is
+    capped at ``max_steps`` cells entered, so a crowded board costs a fixed
+    amount per word instead of an exponential number of walks.
+    """
+
+    def __init__(
+        self,
+        neighbors: int,
+        rng: np.random.Generator,
+        max_attempts: int = 20,
+        max_steps: int = 2_000,
+    ) -> None:
+        if neighbors not in NEIGHBORHOODS:
+            raise ValueError(f"neighbors must be one of {sorted(NEIGHBORHOODS)}")
+        super().__init__((PATH_DIRECTION,), rng)
+        self.neighbors = neighbors
+        self.max_attempts = max_attempts
+        self.max_steps = max_steps
+
+    def _order(self, words: Sequence[str]) -> Sequence[str]:
+        return constraint_order(words)
+
+    def _pick(self, grid: Grid, word: str, codes: np.ndarray) -> PathPlacement | None:
+        adj = adjacency(grid.rows, grid.cols, self.neighbors)
+        # available[k]: cells that can hold letter k of the word.
+        available = (grid.cells == EMPTY) | (grid.cells[None, :] == codes[:, None])
+        # Padding column so that -1 neighbours read as unavailable.
+        available = np.concatenate([available, np.zeros((len(codes), 1), dtype=bool)], axis=1)
+        starts = np.flatnonzero(available[0, :-1])
+        if len(codes) > 1:
+            starts = starts[available[1][adj[starts]].any(axis=1)]
+        self._steps = 0
+        for start in starts[self.rng.permutation(starts.size)]:
+            path = self._walk(grid, adj, available, codes, [int(start)])
+            if path is not None:
+                return PathPlacement(word, tuple(path), grid.cols)
+            if self._steps >= self.max_steps:
+                break
+        return None
+
+    def _walk(
+        self,
+        grid: Grid,
+        adj: np.ndarray,
+        available: np.ndarray,
+        codes: np.ndarray,
+        path: list[int],
+    ) -> list[int] | None:
+        k = len(path)
+        if k == len(codes):
+            return path
+        self._steps += 1
+        if self._steps > self.max_steps:
+            return None
+        options = adj[path[-1]]
+        options = options[available[k][options]]
+        options = options[~np.isin(options, path)]
+        if k + 1 < len(codes):
+            # Lookahead: the letter after this one must have a free neighbour.
+            options = options[available[k + 1][adj[options]].any(axis=1)]
+        if options.size == 0:
+            return None
+        options = options[self.rng.permutation(options.size)]
+        shared = grid.cells[options] == codes[k]
+        for cell in options[np.argsort(~shared, kind="stable")]:
+            found = self._walk(grid, adj, available, codes, path + [int(cell)])
+            if found is not None:
+                return found
+        return None
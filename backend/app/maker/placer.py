@@ -0,0 +1,460 @@
+"""Placement strategies used by the Maker.
+
+A placer receives an empty :class:`Grid` and the normalized word list and
+either returns one :class:`Placement` per word (leaving the letters written
+into the grid) or raises :class:`PlacementError`.  Given a
+:class:`~app.maker.deadline.Deadline`, placers never raise: they return the
+best partial layout found when time runs out.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+from .deadline import Deadline
+from .errors import PlacementError
+from .grid import DIRECTIONS, EMPTY, Grid, Placement, _start_span, encode_word, placements_from_mask
+
+# Relative frequency (%) of letters in English text, used to place words with
+# rare letters first: they have the fewest chances to share cells later.
+ENGLISH_LETTER_FREQUENCY = {
+    "E": 12.7, "T": 9.1, "A": 8.2, "O": 7.5, "I": 7.0, "N": 6.7, "S": 6.3,
+    "H": 6.1, "R": 6.0, "D": 4.3, "L": 4.0, "C": 2.8, "U": 2.8, "M": 2.4,
+    "W": 2.4, "F": 2.2, "G": 2.0, "Y": 2.0, "P": 1.9, "B": 1.5, "V": 0.98,
+    "K": 0.77, "J": 0.15, "X": 0.15, "Q": 0.095, "Z": 0.074,
+}
+_UNKNOWN_LETTER_FREQUENCY = 0.05
+
+
+def rarity(word: str) -> float:
+    """Sum of the surprisal of each letter; higher means harder to overlap."""
+    return sum(
+        -math.log(ENGLISH_LETTER_FREQUENCY.get(ch, _UNKNOWN_LETTER_FREQUENCY) / 100)
+        for ch in word
+    )
+
+
+def constraint_order(words: Sequence[str]) -> list[str]:
+    """Most-constrained-first: longest words, then those with the rarest letters."""
+    return sorted(words, key=lambda w: (-len(w), -rarity(w), w))
+
+
+class _GreedyPlacer:
+    """Places words one at a time, never revisiting a choice.
+
+    Subclasses pick a start for a word with :meth:`_pick`.  On a dead end the
+    grid is rebuilt, up to ``max_attempts`` times.  With a ``deadline`` the
+    placer never fails: words that do not fit are skipped, and once the
+    deadline passes or the attempts run out the attempt that placed the most
+    words is returned.
+    """
+
+    max_attempts: int
+
+    def __init__(self, directions: Sequence[str], rng: np.random.Generator) -> None:
+        self.directions = tuple(directions)
+        self.rng = rng
+
+    def place(
+        self, grid: Grid, words: Sequence[str], deadline: Deadline | None = None
+    ) -> list[Placement]:
+        best: tuple[list[Placement], np.ndarray] | None = None
+        for _ in range(self.max_attempts):
+            placements, complete = self._attempt(grid, self._order(words), deadline)
+            if complete:
+                return placements
+            if best is None or len(placements) > len(best[0]):
+                best = placements, grid.cells.copy()
+            grid.reset()
+            if deadline is not None and deadline.expired():
+                break
+        if deadline is None:
+            raise PlacementError(
+                f"could not place all words in a {grid.rows}x{grid.cols} grid "
+                f"after {self.max_attempts} attempts"
+            )
+        placements, cells = best
+        grid.cells[:] = cells
+        return placements
+
+    def _order(self, words: Sequence[str]) -> Sequence[str]:
+        return words
+
+    def _attempt(
+        self, grid: Grid, words: Sequence[str], deadline: Deadline | None
+    ) -> tuple[list[Placement], bool]:
+        placements = []
+        complete = True
+        for word in words:
+            if deadline is not None and deadline.expired():
+                return placements, False
+            codes = encode_word(word)
+            placement = self._pick(grid, word, codes)
+            if placement is None:
+                if deadline is None:
+                    return placements, False
+                complete = False
+                continue
+            grid.place(placement, codes)
+            placements.append(placement)
+        return placements, complete
+
+    def _pick(self, grid: Grid, word: str, codes: np.ndarray) -> Placement | None:
+        raise NotImplementedError
+
+
+class RandomPlacer(_GreedyPlacer):
+    """Place each word at a random legal start."""
+
+    def __init__(
+        self, directions: Sequence[str], rng: np.random.Generator, max_attempts: int = 20
+    ) -> None:
+        super().__init__(directions, rng)
+        self.max_attempts = max_attempts
+
+    def _pick(self, grid: Grid, word: str, codes: np.ndarray) -> Placement | None:
+        mask = grid.candidates(codes, self.directions)
+        flat = np.flatnonzero(mask)
+        if flat.size == 0:
+            return None
+        pick = flat[self.rng.integers(flat.size)]
+        return placements_from_mask(word, mask, self.directions, [pick])[0]
+
+
+class CompactPlacer(_GreedyPlacer):
+    """Greedy placement that maximizes letters shared with placed words.
+
+    Every legal start is scored by its overlap with the board in the same
+    vectorized pass that finds it; each word goes to one of the
+    highest-scoring starts, which packs the words into as few cells as
+    possible.
+    """
+
+    def __init__(
+        self, directions: Sequence[str], rng: np.random.Generator, max_attempts: int = 5
+    ) -> None:
+        super().__init__(directions, rng)
+        self.max_attempts = max_attempts
+
+    def _order(self, words: Sequence[str]) -> Sequence[str]:
+        return constraint_order(words)
+
+    def _pick(self, grid: Grid, word: str, codes: np.ndarray) -> Placement | None:
+        mask, shared = grid.scored_candidates(codes, self.directions)
+        if not mask.any():
+            return None
+        best = np.flatnonzero(mask & (shared == shared[mask].max()))
+        pick = best[self.rng.integers(best.size)]
+        return placements_from_mask(word, mask, self.directions, [pick])[0]
+
+
+# Default search budget of BacktrackingPlacer: about two seconds on a
+# 15x15 grid before a word list that does not fit is rejected.  Lists that
+# fit are nearly always laid out within a few hundred nodes.
+MAX_NODES = 5_000
+
+
+class _Slots:
+    """Every in-bounds straight line of one length over usable cells of a grid.
+
+    ``index[i]`` holds the flat cells of slot ``i`` in reading order, so a
+    single gather ``cells[index]`` yields the board contents under every
+    possible placement of a word of that length.
+    """
+
+    def __init__(self, grid: Grid, length: int, directions: Sequence[str]) -> None:
+        cols = grid.cols
+        starts, dirs, steps = [], [], []
+        for d, name in enumerate(directions):
+            dr, dc = DIRECTIONS[name]
+            r0, r1 = _start_span(grid.rows, dr, length)
+            c0, c1 = _start_span(cols, dc, length)
+            if r0 >= r1 or c0 >= c1:
+                continue
+            r, c = np.mgrid[r0:r1, c0:c1]
+            runs = grid.run_lengths(name)
+            if runs is not None:
+                # Shaped grid: only starts with enough usable cells ahead.
+                fits = runs[r0:r1, c0:c1] >= length
+                r, c = r[fits], c[fits]
+            flat = (r * cols + c).ravel()
+            starts.append(flat)
+            dirs.append(np.full(flat.size, d))
+            steps.append(np.full(flat.size, dr * cols + dc))
+        self.start = np.concatenate(starts) if starts else np.empty(0, dtype=np.intp)
+        self.direction = np.concatenate(dirs) if dirs else np.empty(0, dtype=np.intp)
+        step = np.concatenate(steps) if steps else np.empty(0, dtype=np.intp)
+        self.index = self.start[:, None] + step[:, None] * np.arange(length)
+
+
+class _SearchExhausted(Exception):
+    pass
+
+
+class _Candidates:
+    """Legal slots of every word of one length, kept current as cells fill.
+
+    ``legal[s, g]`` says whether word ``members[g]`` fits slot ``s`` and
+    ``fresh[s]`` counts the empty cells under it.  Both are built with one
+    gather over the board; afterwards :meth:`claim` updates only the slots
+    crossing newly claimed cells, found through a cell -> (slot, offset)
+    table, and returns what :meth:`undo` needs to step back.
+    """
+
+    # Words compared per chunk while building, so a deadline is noticed.
+    BUILD_CHUNK = 32
+
+    def __init__(
+        self,
+        slots: _Slots,
+        cells: np.ndarray,
+        members: list[int],
+        codes: np.ndarray,
+        deadline: Deadline | None = None,
+    ) -> None:
+        self.row = {word_index: g for g, word_index in enumerate(members)}
+        under = cells[slots.index]
+        empty = under == EMPTY
+        self.fresh = empty.sum(axis=1)
+        # Every word fits an all-empty slot; only the rest need comparing.
+        self.legal = np.ones((under.shape[0], len(members)), dtype=bool)
+        lettered = np.flatnonzero(self.fresh < codes.shape[1])
+        under, empty = under[lettered], empty[lettered]
+        for g in range(0, len(members), self.BUILD_CHUNK):
+            if deadline is not None and deadline.expired():
+                raise _SearchExhausted
+            chunk = codes[g : g + self.BUILD_CHUNK, None, :]
+            fits = (empty | (under == chunk)).all(axis=-1)
+            self.legal[lettered, g : g + self.BUILD_CHUNK] = fits.T
+        self.counts = self.legal.sum(axis=0)
+        # Letter of every member at each offset, one row per offset.
+        self._letters = np.ascontiguousarray(codes.T)
+        length = codes.shape[1]
+        flat = slots.index.ravel()
+        order = np.argsort(flat, kind="stable")
+        self._slot, self._offset = np.divmod(order, length)
+        self._first = np.searchsorted(flat[order], np.arange(cells.size + 1))
+
+    def claim(self, indices: np.ndarray, letters: np.ndarray) -> tuple | None:
+        """Account for ``letters`` written into the empty cells ``indices``."""
+        first, last = self._first[indices], self._first[indices + 1]
+        sizes = last - first
+        total = int(sizes.sum())
+        if total == 0:
+            return None
+        # Every (slot, offset) pair crossing a claimed cell, grouped by slot.
+        pairs = np.repeat(first - np.cumsum(sizes) + sizes, sizes) + np.arange(total)
+        letter = np.repeat(letters, sizes)
+        by_slot = np.argsort(self._slot[pairs], kind="stable")
+        pairs, letter = pairs[by_slot], letter[by_slot]
+        slot = self._slot[pairs]
+        np.subtract.at(self.fresh, slot, 1)
+        bounds = np.flatnonzero(np.concatenate(([True], slot[1:] != slot[:-1])))
+        touched = slot[bounds]
+        # The cells were empty, so only the new letters can rule a slot out.
+        matches = self._letters[self._offset[pairs]] == letter[:, None]
+        before = self.legal[touched]
+        after = before & np.logical_and.reduceat(matches, bounds, axis=0)
+        self.legal[touched] = after
+        lost = before.sum(axis=0, dtype=np.intp) - after.sum(axis=0, dtype=np.intp)
+        self.counts -= lost
+        return slot, touched, before, lost
+
+    def undo(self, token: tuple | None) -> None:
+        if token is None:
+            return
+        slot, touched, before, lost = token
+        np.add.at(self.fresh, slot, 1)
+        self.legal[touched] = before
+        self.counts += lost
+
+
+class BacktrackingPlacer:
+    """Complete depth-first placement with forward checking.
+
+    The search keeps a candidate bitmap per unplaced word (one bit per slot
+    of that word's length), built once with one gather per word length and
+    then updated, as words are placed and taken back, only for the slots
+    crossing the cells they claim.  The next word is the one with the fewest
+    surviving candidates, ties going to the static most-constrained-first
+    order; a node whose bitmaps leave any word without a candidate is
+    abandoned immediately.
+
+    The search is bounded by ``max_nodes`` rather than wall-clock time, so the
+    result for a given seed is reproducible and the cost has a fixed ceiling
+    (a node costs well under a millisecond on puzzle-sized grids).  Within
+    that budget a layout is found whenever one exists.  With a ``deadline``
+    the search also stops when it passes, and instead of failing returns the
+    deepest partial layout it reached.
+
+    With ``reserve`` the layout must leave exactly that many usable cells
+    empty (for a hidden message).  Each node bounds the cells the remaining
+    words can still claim by the most empty cells under any of their legal
+    slots, and is abandoned once the free cells can no longer be brought to
+    exactly the target; slots are tried in order of how closely they keep
+    to the target pace.
+    """
+
+    def __init__(
+        self,
+        directions: Sequence[str],
+        rng: np.random.Generator,
+        max_nodes: int = MAX_NODES,
+        reserve: int | None = None,
+    ) -> None:
+        self.directions = tuple(directions)
+        self.rng = rng
+        self.max_nodes = max_nodes
+        self.reserve = reserve
+
+    def place(
+        self, grid: Grid, words: Sequence[str], deadline: Deadline | None = None
+    ) -> list[Placement]:
+        self._grid = grid
+        self._deadline = deadline
+        self._best: tuple[dict[int, Placement], np.ndarray] = ({}, grid.cells.copy())
+        self._words = constraint_order(words)
+        self._codes = [encode_word(w) for w in self._words]
+        self._nodes = 0
+        self._assigned: dict[int, Placement] = {}
+        self._free = int((grid.cells == EMPTY).sum())
+        if self.reserve is not None and self._free - sum(map(len, self._words)) > self.reserve:
+            raise PlacementError(
+                f"the words cover at most {sum(map(len, self._words))} of "
+                f"{self._free} free cells, leaving more than {self.reserve}",
+                unplaced=list(self._words),
+            )
+        try:
+            # On a large grid building the bitmaps alone can outlast a deadline.
+            self._build_candidates()
+            found = self._search()
+        except _SearchExhausted:
+            if deadline is not None:
+                return self._restore_best()
+            grid.reset()
+            raise PlacementError(
+                f"no layout found within {self.max_nodes} search nodes",
+                unplaced=[w for i, w in enumerate(self._words) if i not in self._assigned],
+            ) from None
+        if not found:
+            if deadline is not None:
+                return self._restore_best()
+            raise PlacementError(
+                f"the words cannot all fit in a {grid.rows}x{grid.cols} grid "
+                "with the allowed directions",
+                unplaced=list(self._words),
+            )
+        return [self._assigned[i] for i in range(len(self._words))]
+
+    def _restore_best(self) -> list[Placement]:
+        assigned, cells = self._best
+        self._grid.cells[:] = cells
+        return [assigned[i] for i in sorted(assigned)]
+
+    def _build_candidates(self) -> None:
+        """Slots and candidate bitmaps per word length, minding the deadline."""
+        by_length: dict[int, list[int]] = {}
+        for i, word in enumerate(self._words):
+            by_length.setdefault(len(word), []).append(i)
+        self._slots: dict[int, _Slots] = {}
+        self._candidates: dict[int, _Candidates] = {}
+        for length, group in sorted(by_length.items()):
+            if self._deadline is not None and self._deadline.expired():
+                raise _SearchExhausted
+            slots = self._slots[length] = _Slots(self._grid, length, self.directions)
+            codes = np.stack([self._codes[i] for i in group])
+            self._candidates[length] = _Candidates(
+                slots, self._grid.cells, group, codes, self._deadline
+            )
+
+    def _bits(self, word_index: int) -> np.ndarray:
+        candidates = self._candidates[len(self._words[word_index])]
+        return candidates.legal[:, candidates.row[word_index]]
+
+    def _count(self, word_index: int) -> int:
+        candidates = self._candidates[len(self._words[word_index])]
+        return int(candidates.counts[candidates.row[word_index]])
+
+    def _search(self) -> bool:
+        remaining = [i for i in range(len(self._words)) if i not in self._assigned]
+        if not remaining:
+            return self.reserve is None or self._free == self.reserve
+        if len(self._assigned) > len(self._best[0]):
+            self._best = dict(self._assigned), self._grid.cells.copy()
+        self._nodes += 1
+        if self._nodes > self.max_nodes or self._deadline is not None and self._deadline.expired():
+            raise _SearchExhausted
+        counts = {i: self._count(i) for i in remaining}
+        if min(counts.values()) == 0:
+            return False
+        claims = None
+        if self.reserve is not None:
+            claims = {
+                i: self._candidates[len(self._words[i])].fresh[self._bits(i)] for i in remaining
+            }
+            # Claims only shrink as the board fills, so today's largest
+            # claims bound what the remaining words can still cover.
+            most = sum(int(c.max()) for c in claims.values())
+            if not self._free - most <= self.reserve <= self._free:
+                return False
+        word_index = min(remaining, key=lambda i: (counts[i], i))
+        for slot in self._order_slots(word_index, self._bits(word_index), remaining, claims):
+            placement = self._placement(word_index, slot)
+            claimed = self._grid.place(placement, self._codes[word_index])
+            letters = self._grid.cells[claimed]
+            undo = [(c, c.claim(claimed, letters)) for c in self._candidates.values()]
+            self._assigned[word_index] = placement
+            self._free -= claimed.size
+            if self._search():
+                return True
+            self._free += claimed.size
+            del self._assigned[word_index]
+            for candidates, token in reversed(undo):
+                candidates.undo(token)
+            self._grid.clear(claimed)
+        return False
+
+    def _order_slots(
+        self,
+        word_index: int,
+        bits: np.ndarray,
+        remaining: list[int],
+        claims: dict[int, np.ndarray] | None,
+    ) -> np.ndarray:
+        """Legal slots, most shared letters first, ties in seeded random order.
+
+        With a reserve, slots that would make the target unreachable are
+        dropped and the rest go closest-to-pace first: the word should claim
+        its share, by length, of the cells still to be covered.
+        """
+        word = self._words[word_index]
+        legal = np.flatnonzero(bits)
+        legal = legal[self.rng.permutation(legal.size)]
+        # In a legal slot every cell that is not empty already holds the
+        # right letter, so the cells a slot claims are its empty ones.
+        claim = self._candidates[len(word)].fresh[legal]
+        if claims is None:
+            return legal[np.argsort(claim, kind="stable")]
+        others = sum(int(claims[i].max()) for i in remaining if i != word_index)
+        left = self._free - claim
+        feasible = (left >= self.reserve) & (left - others <= self.reserve)
+        legal, claim = legal[feasible], claim[feasible]
+        to_cover = self._free - self.reserve
+        pace = to_cover * len(word) / sum(len(self._words[i]) for i in remaining)
+        return legal[np.argsort(np.abs(claim - pace), kind="stable")]
+
+    def _placement(self, word_index: int, slot: int) -> Placement:
+        word = self._words[word_index]
+        slots = self._slots[len(word)]
+        row, col = divmod(int(slots.start[slot]), self._grid.cols)
+        return Placement(word, row, col, self.directions[slots.direction[slot]])
+
+
+PLACERS = {
+    "random": RandomPlacer,
+    "backtrack": BacktrackingPlacer,
+    "compact": CompactPlacer,
+}
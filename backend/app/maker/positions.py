@@ -0,0 +1,62 @@
+"""Packed integer encoding of a word's position on the grid.
+
+A straight-line placement is fully described by its start cell, direction
+and length, packed into one 52-bit integer (fits SQLite's signed 64-bit
+INTEGER)::
+
+    bits 36-51  start row
+    bits 20-35  start column
+    bits 16-19  direction, as an index into DIRECTION_NAMES
+    bits  0-15  length
+
+Answer checks then work on the integer directly instead of on a list of
+coordinates.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from .grid import DIRECTION_NAMES, DIRECTIONS
+
+_FIELD = 0xFFFF
+_DIRECTION_INDEX = {name: i for i, name in enumerate(DIRECTION_NAMES)}
+
+
+def encode_position(row: int, col: int, direction: str, length: int) -> int:
+    if not (0 <= row <= _FIELD and 0 <= col <= _FIELD and 0 < length <= _FIELD):
+        raise ValueError("position out of range for packed encoding")
+    return (row << 36) | (col << 20) | (_DIRECTION_INDEX[direction] << 16) | length
+
+
+def decode_position(packed: int) -> tuple[int, int, str, int]:
+    """Return ``(row, col, direction, length)``."""
+    return (
+        (packed >> 36) & _FIELD,
+        (packed >> 20) & _FIELD,
+        DIRECTION_NAMES[(packed >> 16) & 0xF],
+        packed & _FIELD,
+    )
+
+
+def position_endpoints(packed: int) -> tuple[tuple[int, int], tuple[int, int]]:
+    """First and last cell of the word."""
+    row, col, direction, length = decode_position(packed)
+    dr, dc = DIRECTIONS[direction]
+    return (row, col), (row + dr * (length - 1), col + dc * (length - 1))
+
+
+def position_cells(packed: int) -> list[tuple[int, int]]:
+    row, col, direction, length = decode_position(packed)
+    dr, dc = DIRECTIONS[direction]
+    return [(row + dr * k, col + dc * k) for k in range(length)]
+
+
+def encode_coordinates(cells: Sequence[Sequence[int]]) -> int:
+    """Pack a straight run of ``[row, col]`` cells (the legacy JSON format)."""
+    (r0, c0), length = cells[0], len(cells)
+    if length == 1:
+        return encode_position(r0, c0, DIRECTION_NAMES[0], 1)
+    step = (cells[1][0] - r0, cells[1][1] - c0)
+    direction = next(name for name, delta in DIRECTIONS.items() if delta == step)
+    return encode_position(r0, c0, direction, length)
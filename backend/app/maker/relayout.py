@@ -0,0 +1,75 @@
+"""Incremental re-layout of an existing puzzle after its word list changes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+from .alphabet import detect_alphabet
+from .filler import fill_without_duplicates
+from .grid import BLOCKED, DIRECTION_NAMES, EMPTY, Grid, Placement, encode_word
+from .placer import BacktrackingPlacer
+from .scan import WordScanner
+
+
+@dataclass
+class Relayout:
+    grid: Grid
+    kept: list[Placement]
+    added: list[Placement]
+    removed: list[Placement] = field(default_factory=list)
+
+
+def relayout(
+    rows: Sequence[str],
+    placements: Sequence[Placement],
+    words: Sequence[str],
+    directions: Sequence[str] = DIRECTION_NAMES,
+    seed: int | None = None,
+) -> Relayout:
+    """Change the word list of a finished grid without rebuilding it.
+
+    Words still in the list keep their cells.  Cells only used by removed
+    words are freed, new words are placed around the kept letters by the
+    backtracking placer, and the filler is repaired: old filler letters stay
+    where they are unless they now spell a word, freed and leftover cells
+    get fresh letters.  The alphabet is inferred from the grid itself.
+    """
+    alphabet = detect_alphabet("".join(rows))
+    target = list(dict.fromkeys(w for w in (alphabet.normalize(w) for w in words) if w))
+    if not target:
+        raise ValueError("words must not be empty")
+    kept = [p for p in placements if p.word in target]
+    removed = [p for p in placements if p.word not in target]
+    placed_words = {p.word for p in kept}
+    new_words = [w for w in target if w not in placed_words]
+
+    old = encode_word("".join(rows))
+    shape = (len(rows), len(rows[0]))
+    usable = (old != BLOCKED).reshape(shape)
+    grid = Grid(*shape, mask=None if usable.all() else usable)
+    if max((len(w) for w in new_words), default=0) > max(grid.rows, grid.cols):
+        raise ValueError("words longer than the grid")
+    covered = np.zeros(grid.cells.size, dtype=bool)
+    for p in placements:
+        covered[p.indices(grid.cols)] = True
+    for p in kept:
+        index = p.indices(grid.cols)
+        grid.cells[index] = old[index]
+
+    rng = np.random.default_rng(seed)
+    directions = tuple(d for d in DIRECTION_NAMES if d in directions)
+    added = BacktrackingPlacer(directions, rng).place(grid, new_words) if new_words else []
+
+    # Reuse old filler letters; cells freed by removed words get fresh ones.
+    keep = np.where(covered, EMPTY, old).astype(np.uint32)
+    fill_without_duplicates(
+        grid,
+        kept + added,
+        alphabet.sampler(rng),
+        scanner=WordScanner(target),
+        keep=keep,
+    )
+    return Relayout(grid, kept, added, removed)
@@ -0,0 +1,93 @@
+"""Scan every line of a grid for a set of words in all 8 directions.
+
+Rows, columns and both diagonal families are read in one direction only;
+matching each word and its reverse covers the opposite four directions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .automaton import Automaton
+from .grid import encode_word
+
+# Reading direction of each line family.
+LINE_FAMILIES = ("right", "down", "down_right", "down_left")
+_OPPOSITE = {"right": "left", "down": "up", "down_right": "up_left", "down_left": "up_right"}
+
+
+@lru_cache(maxsize=32)
+def grid_lines(rows: int, cols: int) -> tuple[tuple[str, np.ndarray], ...]:
+    """Every line of a ``rows`` x ``cols`` grid as ``(family, flat indices)``."""
+    board = np.arange(rows * cols).reshape(rows, cols)
+    lines: list[tuple[str, np.ndarray]] = []
+    lines += [("right", row) for row in board]
+    lines += [("down", col) for col in board.T]
+    lines += [("down_right", board.diagonal(k)) for k in range(-(rows - 1), cols)]
+    flipped = board[:, ::-1]
+    lines += [("down_left", flipped.diagonal(k)) for k in range(cols - 1, -rows, -1)]
+    return tuple(lines)
+
+
+@lru_cache(maxsize=32)
+def lines_by_cell(rows: int, cols: int) -> np.ndarray:
+    """``(rows * cols, 4)`` array: the line number of each cell in each family."""
+    table = np.empty((rows * cols, len(LINE_FAMILIES)), dtype=np.intp)
+    for number, (family, indices) in enumerate(grid_lines(rows, cols)):
+        table[indices, LINE_FAMILIES.index(family)] = number
+    return table
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    word: str
+    row: int
+    col: int
+    direction: str
+    indices: tuple[int, ...]
+
+    @property
+    def cells(self) -> frozenset[int]:
+        return frozenset(self.indices)
+
+
+class WordScanner:
+    """Aho-Corasick over a word list and its reverses."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self._entries: list[tuple[str, bool]] = []
+        patterns = []
+        for word in dict.fromkeys(words):
+            codes = encode_word(word)
+            patterns.append(codes.tolist())
+            self._entries.append((word, False))
+            if word != word[::-1]:
+                patterns.append(codes[::-1].tolist())
+                self._entries.append((word, True))
+        self._automaton = Automaton(patterns)
+
+    def scan(
+        self, cells: np.ndarray, cols: int, lines: Sequence[tuple[str, np.ndarray]]
+    ) -> list[Occurrence]:
+        occurrences = []
+        for family, indices in lines:
+            for end, pattern in self._automaton.iter_matches(cells[indices].tolist()):
+                word, reverse = self._entries[pattern]
+                span = indices[end - len(word) + 1 : end + 1]
+                if reverse:
+                    span = span[::-1]
+                start = int(span[0])
+                occurrences.append(
+                    Occurrence(
+                        word,
+                        start // cols,
+                        start % cols,
+                        _OPPOSITE[family] if reverse else family,
+                        tuple(int(i) for i in span),
+                    )
+                )
+        return occurrences
@@ -0,0 +1,75 @@
+"""Shaped grids: which cells of the rectangle are usable.
+
+A shape is a boolean ``(rows, cols)`` mask, ``True`` for usable cells.  It
+travels packed to one bit per cell (:func:`pack_mask`), and the grid turns
+it into per-direction run lengths (:func:`~app.maker.grid.run_lengths`) so
+candidate starts that would cross a masked cell are never enumerated.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+from typing import Callable, Sequence
+
+import numpy as np
+
+BITMAP_USABLE = frozenset("#1Xx")
+
+
+def _unit_coordinates(rows: int, cols: int) -> tuple[np.ndarray, np.ndarray]:
+    """Cell centres scaled to ``[-1, 1]``, ``y`` pointing up."""
+    y = 1 - 2 * (np.arange(rows) + 0.5) / rows
+    x = 2 * (np.arange(cols) + 0.5) / cols - 1
+    return np.meshgrid(x, y)
+
+
+def circle(rows: int, cols: int) -> np.ndarray:
+    x, y = _unit_coordinates(rows, cols)
+    return x**2 + y**2 <= 1
+
+
+def heart(rows: int, cols: int) -> np.ndarray:
+    x, y = _unit_coordinates(rows, cols)
+    x, y = x * 1.2, y * 1.25 + 0.15
+    return (x**2 + y**2 - 1) ** 3 - x**2 * y**3 <= 0
+
+
+def star(rows: int, cols: int) -> np.ndarray:
+    """Five-pointed star, by even-odd ray casting against its ten edges."""
+    x, y = _unit_coordinates(rows, cols)
+    angles = math.pi / 2 + np.arange(10) * math.pi / 5
+    radii = np.where(np.arange(10) % 2 == 0, 1.0, 0.45)
+    vx, vy = radii * np.cos(angles), radii * np.sin(angles) - 0.08
+    inside = np.zeros(x.shape, dtype=bool)
+    for i in range(10):
+        x1, y1, x2, y2 = vx[i], vy[i], vx[i - 1], vy[i - 1]
+        crosses = (y1 > y) != (y2 > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            edge_x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        inside ^= crosses & (x < edge_x)
+    return inside
+
+
+SHAPES: dict[str, Callable[[int, int], np.ndarray]] = {
+    "circle": circle,
+    "heart": heart,
+    "star": star,
+}
+
+
+def mask_from_bitmap(bitmap: Sequence[str]) -> np.ndarray:
+    """Parse rows such as ``".##."``; ``#``, ``X`` or ``1`` mark usable cells."""
+    if not bitmap or any(len(row) != len(bitmap[0]) for row in bitmap):
+        raise ValueError("bitmap rows must all have the same length")
+    return np.array([[ch in BITMAP_USABLE for ch in row] for row in bitmap], dtype=bool)
+
+
+def pack_mask(mask: np.ndarray) -> str:
+    """One bit per cell, row-major, base64 encoded."""
+    return base64.b64encode(np.packbits(mask.ravel()).tobytes()).decode()
+
+
+def unpack_mask(data: str, rows: int, cols: int) -> np.ndarray:
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(data), dtype=np.uint8))
+    return bits[: rows * cols].astype(bool).reshape(rows, cols)
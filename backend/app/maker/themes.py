@@ -0,0 +1,44 @@
+"""Built-in word lists and difficulty presets used for quick play."""
+
+from __future__ import annotations
+
+THEMES: dict[str, list[str]] = {
+    "animals": [
+        "CAT", "DOG", "HORSE", "TIGER", "LION", "ZEBRA", "RABBIT", "MONKEY",
+        "ELEPHANT", "GIRAFFE", "PANDA", "KOALA", "EAGLE", "SHARK", "WHALE",
+        "DOLPHIN", "TURTLE", "SNAKE", "FROG", "OWL", "PENGUIN", "FOX",
+    ],
+    "fruits": [
+        "APPLE", "BANANA", "CHERRY", "GRAPE", "LEMON", "MANGO", "MELON",
+        "ORANGE", "PEACH", "PEAR", "PLUM", "KIWI", "LIME", "PAPAYA",
+        "APRICOT", "COCONUT", "FIG", "GUAVA", "LYCHEE", "PERSIMMON",
+    ],
+    "colors": [
+        "RED", "BLUE", "GREEN", "YELLOW", "PURPLE", "ORANGE", "PINK", "BROWN",
+        "BLACK", "WHITE", "GRAY", "CYAN", "MAGENTA", "VIOLET", "INDIGO",
+        "TEAL", "NAVY", "MAROON", "OLIVE", "GOLD", "SILVER", "BEIGE",
+    ],
+    "space": [
+        "SUN", "MOON", "STAR", "PLANET", "COMET", "GALAXY", "NEBULA", "ORBIT",
+        "ROCKET", "MARS", "VENUS", "SATURN", "JUPITER", "MERCURY", "URANUS",
+        "NEPTUNE", "ASTEROID", "METEOR", "ECLIPSE", "COSMOS", "ASTRONAUT",
+    ],
+    "school": [
+        "BOOK", "PENCIL", "ERASER", "RULER", "DESK", "CHAIR", "TEACHER",
+        "STUDENT", "LESSON", "HOMEWORK", "LIBRARY", "SCIENCE", "HISTORY",
+        "MUSIC", "ART", "MATH", "CLASS", "EXAM", "NOTEBOOK", "RECESS",
+    ],
+}
+
+DIFFICULTIES: dict[str, dict] = {
+    "easy": {"directions": ["right", "down"], "word_count": 8},
+    "medium": {"directions": ["right", "down", "down_right", "up_right"], "word_count": 12},
+    "hard": {
+        "directions": [
+            "right", "down", "down_right", "up_right", "left", "up", "up_left", "down_left",
+        ],
+        "word_count": 16,
+    },
+}
+
+QUICK_PLAY_SIZES: tuple[int, ...] = (10, 15, 20)
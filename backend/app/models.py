@@ -0,0 +1,123 @@
+"""ORM models (see the ERD in the README)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .database import Base
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    password_hash: Mapped[str] = mapped_column(String(255))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    games: Mapped[list[Game]] = relationship(back_populates="creator")
+
+
+class Game(Base):
+    __tablename__ = "games"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    creator_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    title: Mapped[str] = mapped_column(String(200))
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
+    link_code: Mapped[str] = mapped_column(String(16), unique=True, index=True)
+    rows: Mapped[int] = mapped_column(Integer)
+    cols: Mapped[int] = mapped_column(Integer)
+    # Grid rows joined with "\n", one character per cell.
+    grid: Mapped[str] = mapped_column(Text)
+    # 0-100 score from app.maker.difficulty, set when the grid is generated.
+    difficulty: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
+    # "classic" (find the listed words) or "boggle" (trace any dictionary word).
+    mode: Mapped[str] = mapped_column(String(16), default="classic", server_default="classic")
+    # Bumped by every word list edit; progress bitmaps are only valid for
+    # the word order of the version they were computed against.
+    words_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Hidden-message games: the message the uncovered cells spell.
+    message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Boggle games: every traceable dictionary word, packed by app.boggle.
+    boggle_words: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+
+    creator: Mapped[User | None] = relationship(back_populates="games")
+    words: Mapped[list[GameWord]] = relationship(
+        back_populates="game", cascade="all, delete-orphan", order_by="GameWord.id"
+    )
+    participants: Mapped[list[GameParticipant]] = relationship(
+        back_populates="game", cascade="all, delete-orphan"
+    )
+
+
+class GameWord(Base):
+    __tablename__ = "game_words"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_id: Mapped[int] = mapped_column(ForeignKey("games.id"), index=True)
+    word: Mapped[str] = mapped_column(String(100))
+    # Start cell, direction and length packed by app.maker.positions; null
+    # for snaking words, which store their cells in ``path`` instead.
+    position_data: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # Flat cell indices of a snaking word (app.maker.paths.encode_path).
+    path: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Ordered hints as JSON (app.hints), computed when the word is placed.
+    hints: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
+
+    game: Mapped[Game] = relationship(back_populates="words")
+
+
+class GameParticipant(Base):
+    __tablename__ = "game_participants"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_id: Mapped[int] = mapped_column(ForeignKey("games.id"), index=True)
+    user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    username: Mapped[str] = mapped_column(String(50))
+    score: Mapped[int] = mapped_column(Integer, default=0)
+    # Bit i set once Game.words[i] is found, see app.progress.
+    found_words: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    # Seconds from joining to finding the last word; null until completed.
+    completion_time: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Boggle games: the words traced so far, sorted and newline-separated.
+    boggle_words: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Why app.anticheat judged the play scripted; null for normal play.
+    flagged: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
+
+    game: Mapped[Game] = relationship(back_populates="participants")
+
+
+class PuzzleCacheEntry(Base):
+    """Disk tier of the Maker's content-addressed puzzle cache."""
+
+    __tablename__ = "puzzle_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # JSON-encoded Puzzle.to_dict() payload.
+    payload: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
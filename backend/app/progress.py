@@ -0,0 +1,44 @@
+"""Participant progress as an integer bitmap over word ordinals.
+
+Bit ``i`` of ``GameParticipant.found_words`` is set once the participant has
+found the game's ``i``-th word (``Game.words`` order).  The whole state is
+one 64-bit column, so marking words found is a single atomic ``found_words
+| :bits`` update and completion is one comparison against :func:`full_mask`.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+# SQLite and PostgreSQL integers are signed 64-bit.
+MAX_WORDS = 63
+
+
+def word_bits(ordinals: Iterable[int]) -> int:
+    bits = 0
+    for ordinal in ordinals:
+        if not 0 <= ordinal < MAX_WORDS:
+            raise ValueError(f"word ordinal {ordinal} cannot be tracked")
+        bits |= 1 << ordinal
+    return bits
+
+
+def found_ordinals(bits: int) -> list[int]:
+    ordinals = []
+    while bits:
+        low = bits & -bits
+        ordinals.append(low.bit_length() - 1)
+        bits ^= low
+    return ordinals
+
+
+def full_mask(word_count: int) -> int:
+    return (1 << word_count) - 1
+
+
+def remap(bits: int, old_ids: Sequence[int], new_ids: Sequence[int]) -> int:
+    """Carry found words across a word list edit, dropping removed words."""
+    position = {word_id: i for i, word_id in enumerate(new_ids)}
+    return word_bits(
+        position[old_ids[i]] for i in found_ordinals(bits) if old_ids[i] in position
+    )
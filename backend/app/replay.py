@@ -0,0 +1,132 @@
+"""Append-only binary replay log of selection events, one file per game.
+
+A log is a 16-byte header followed by fixed-width, length-prefixed records::
+
+    header  magic "WSRP", version (u8), record size (u8), reserved (u16),
+            session start (f64, Unix seconds)
+    record  body length (u16), participant id (u32), milliseconds since
+            session start (u32), start row, start col, end row, end col
+            (u16 each), word ordinal (i8, -1 for a miss), flags (u8)
+
+Every record has the same width, so record ``i`` starts at
+``HEADER.size + i * RECORD.itemsize`` and the whole file reads as one
+numpy structured array: replaying a session, picking out one participant's
+events or re-scoring everyone is a vectorized pass, not a parse loop.  The
+length prefix lets a reader skip records written by a later version.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from .config import settings
+
+MAGIC = b"WSRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHd")
+RECORD = np.dtype(
+    [
+        ("length", "<u2"),
+        ("participant", "<u4"),
+        ("delta_ms", "<u4"),
+        ("start_row", "<u2"),
+        ("start_col", "<u2"),
+        ("end_row", "<u2"),
+        ("end_col", "<u2"),
+        ("ordinal", "i1"),
+        ("flags", "u1"),
+    ]
+)
+BODY_LENGTH = RECORD.itemsize - 2
+
+FOUND = 1
+NEW = 2
+
+# Serializes header creation and appends across request threads.
+_append_lock = threading.Lock()
+
+
+def log_path(game_id: int) -> Path:
+    return Path(settings.replay_dir) / f"{game_id}.wsr"
+
+
+def append_events(
+    game_id: int,
+    participant_id: int,
+    events: Sequence[tuple[tuple[int, int], tuple[int, int], int, int]],
+    at: float | None = None,
+) -> None:
+    """Append ``(start, end, ordinal, flags)`` selections in one write."""
+    at = time.time() if at is None else at
+    path = log_path(game_id)
+    records = np.zeros(len(events), dtype=RECORD)
+    records["length"] = BODY_LENGTH
+    records["participant"] = participant_id
+    # Selections may point off the grid; keep them, clamped to the field.
+    cells = np.clip([(*start, *end) for start, end, _, _ in events], 0, 0xFFFF)
+    for k, name in enumerate(("start_row", "start_col", "end_row", "end_col")):
+        records[name] = cells[:, k]
+    records["ordinal"] = [ordinal for _, _, ordinal, _ in events]
+    records["flags"] = [flags for _, _, _, flags in events]
+    with _append_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a+b") as f:
+            if f.tell() == 0:
+                base = at
+                f.write(HEADER.pack(MAGIC, VERSION, RECORD.itemsize, 0, base))
+            else:
+                f.seek(0)
+                base = _read_header(f.read(HEADER.size))
+                f.seek(0, 2)
+            records["delta_ms"] = max(0, round((at - base) * 1000))
+            f.write(records.tobytes())
+
+
+def _read_header(data: bytes) -> float:
+    magic, version, width, _, base = HEADER.unpack(data)
+    if magic != MAGIC or width < RECORD.itemsize:
+        raise ValueError("not a replay log")
+    return base
+
+
+class ReplayReader:
+    """Memory-mapped view of one game's log."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            header = f.read(HEADER.size)
+        self.started_at = _read_header(header)
+        width = HEADER.unpack(header)[2]
+        count = (path.stat().st_size - HEADER.size) // width
+        if count == 0:
+            self.records = np.zeros(0, dtype=RECORD)
+            return
+        raw = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(count, width))
+        # Newer, wider records keep this layout as their prefix.
+        self.records = np.ascontiguousarray(raw[:, : RECORD.itemsize]).view(RECORD).ravel()
+
+    def __len__(self) -> int:
+        return self.records.size
+
+    def participant(self, participant_id: int) -> np.ndarray:
+        return self.records[self.records["participant"] == participant_id]
+
+    def iter_events(self, participant_id: int | None = None) -> Iterator[dict]:
+        records = self.records if participant_id is None else self.participant(participant_id)
+        for record in records.tolist():
+            _, participant, delta, r0, c0, r1, c1, ordinal, flags = record
+            yield {
+                "participant_id": participant,
+                "t": delta / 1000,
+                "start": [r0, c0],
+                "end": [r1, c1],
+                "ordinal": ordinal if ordinal >= 0 else None,
+                "found": bool(flags & FOUND),
+                "new": bool(flags & NEW),
+            }
@@ -0,0 +1,404 @@
+"""Game endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Iterator, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from .. import crud, replay
+from ..anticheat import FindEvent, analyzer
+from ..boggle import answer_blob, traced_word, word_points
+from ..database import SessionLocal, get_db
+from ..game_cache import GameState, game_cache
+from ..inventory import Bucket, generate_for, inventory
+from ..maker import PlacementError
+from ..maker.batch import generate_puzzle, get_executor
+from ..schemas import (
+    BoggleGuess,
+    BoggleGuessResult,
+    GameCreate,
+    GameOut,
+    GameSummary,
+    GameWordsUpdate,
+    HintsOut,
+    InventoryBucket,
+    ParticipantJoin,
+    ParticipantOut,
+    QuickPlayRequest,
+    Selection,
+    SelectionBatch,
+    SelectionResult,
+    SubmissionResult,
+)
+from ..selections import Match, SelectionIndex
+
+router = APIRouter(prefix="/games", tags=["games"])
+
+
+@router.get("", response_model=list[GameSummary])
+def list_games(
+    min_difficulty: float | None = Query(default=None, ge=0, le=100),
+    max_difficulty: float | None = Query(default=None, ge=0, le=100),
+    sort: Literal["difficulty", "-difficulty", "created_at", "-created_at"] = "-created_at",
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+):
+    return crud.list_games(db, min_difficulty, max_difficulty, sort, limit, offset)
+
+
+def _store_game(
+    db: Session,
+    puzzle: dict,
+    title: str,
+    mode: str,
+    answers: bytes | None,
+    description: str | None = None,
+) -> dict:
+    game = crud.create_game(
+        db, puzzle, title=title, description=description, mode=mode, boggle_words=answers
+    )
+    return GameOut.model_validate(game).model_dump()
+
+
+async def _answers(mode: str, grid: list[str]) -> bytes | None:
+    if mode != "boggle":
+        return None
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), answer_blob, grid)
+
+
+@router.post("", response_model=GameOut, status_code=201)
+async def create_game(spec: GameCreate, db: Session = Depends(get_db)):
+    """Generate a puzzle from a full Maker spec and store it as a new game.
+
+    Unlike quick play every Maker option is available, including snaking
+    words (``strategy="snake"``), shapes and hidden messages.  Words left
+    out by a time budget are not part of the game.
+    """
+    loop = asyncio.get_running_loop()
+    puzzle = await loop.run_in_executor(get_executor(), generate_puzzle, spec.model_dump())
+    if "error" in puzzle:
+        raise HTTPException(status_code=422, detail=puzzle["error"])
+    answers = await _answers(spec.mode, puzzle["grid"])
+    try:
+        return await run_in_threadpool(
+            _store_game, db, puzzle, spec.title, spec.mode, answers, spec.description
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+@router.post("/quick-play", response_model=GameOut)
+async def quick_play(request: QuickPlayRequest, db: Session = Depends(get_db)):
+    """Hand out a ready-made puzzle from the warm inventory as a new game.
+
+    Falls back to generating on the spot when the bucket is empty.  Boggle
+    games find their answer set on the Maker pool before being stored, and
+    the game is written from a worker thread, off the event loop.
+    """
+    bucket = Bucket(request.theme, request.size, request.difficulty)
+    puzzle = inventory.pop(bucket)
+    if puzzle is None:
+        puzzle = await generate_for(bucket)
+        if "error" in puzzle:
+            raise HTTPException(status_code=503, detail="no puzzle available, try again")
+    answers = await _answers(request.mode, puzzle["grid"])
+    return await run_in_threadpool(
+        _store_game, db, puzzle, puzzle["title"], request.mode, answers
+    )
+
+
+@router.get("/quick-play/inventory", response_model=list[InventoryBucket])
+def inventory_depth():
+    return [
+        {**bucket._asdict(), "depth": depth} for bucket, depth in inventory.depth().items()
+    ]
+
+
+def _hot_game(db: Session, link_code: str) -> GameState:
+    state = game_cache.get(db, link_code)
+    if state is None:
+        raise HTTPException(status_code=404, detail="game not found")
+    return state
+
+
+@router.get("/{link_code}", response_model=GameOut)
+def read_game(link_code: str, db: Session = Depends(get_db)):
+    return _hot_game(db, link_code).payload
+
+
+@router.patch("/{link_code}/words", response_model=GameOut)
+def update_words(link_code: str, update: GameWordsUpdate, db: Session = Depends(get_db)):
+    """Edit the word list, re-placing only added and removed words."""
+    game = crud.get_game_by_link_code(db, link_code)
+    if game is None:
+        raise HTTPException(status_code=404, detail="game not found")
+    try:
+        return crud.update_game_words(db, game, update.words, update.directions, update.seed)
+    except (PlacementError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _match(index: SelectionIndex, selection: Selection) -> Match | None:
+    if selection.cells is not None:
+        return index.lookup(selection.cells)
+    return index.lookup_endpoints(selection.start, selection.end)
+
+
+@router.post("/{link_code}/selections", response_model=SelectionResult)
+def check_selection(link_code: str, selection: Selection, db: Session = Depends(get_db)):
+    """Whether the selection, in either direction, is exactly one word."""
+    try:
+        match = _match(_hot_game(db, link_code).index, selection)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if match is None:
+        return {"found": False}
+    return {"found": True, **match._asdict()}
+
+
+@router.get("/{link_code}/words/{word_id}/hints", response_model=HintsOut)
+def read_hints(
+    link_code: str,
+    word_id: int,
+    count: int = Query(default=1, ge=1, le=10),
+    db: Session = Depends(get_db),
+):
+    """The first ``count`` hints for a word, least revealing first."""
+    hints = _hot_game(db, link_code).hints.get(word_id)
+    if hints is None:
+        raise HTTPException(status_code=404, detail="word not found")
+    return {
+        "word_id": word_id,
+        "hints": hints[:count],
+        "remaining": max(0, len(hints) - count),
+    }
+
+
+@router.post("/{link_code}/participants", response_model=ParticipantOut, status_code=201)
+def join_game(link_code: str, join: ParticipantJoin, db: Session = Depends(get_db)):
+    state = _hot_game(db, link_code)
+    try:
+        return crud.join_game(db, state.id, state.word_count, join.username)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+@router.get("/{link_code}/participants/{participant_id}", response_model=ParticipantOut)
+def read_participant(link_code: str, participant_id: int, db: Session = Depends(get_db)):
+    participant = crud.get_participant(db, _hot_game(db, link_code).id, participant_id)
+    if participant is None:
+        raise HTTPException(status_code=404, detail="participant not found")
+    return participant
+
+
+def _check_selections(
+    state: GameState, found: int, batch: SelectionBatch
+) -> tuple[list[dict], list[tuple], int, int, int]:
+    """Match ``batch`` against ``state`` starting from the ``found`` bitmap.
+
+    Returns the per-selection results, their replay events, the new bitmap
+    and the number of new words with the cells their selections span.
+    """
+    results, events = [], []
+    new_words = new_cells = 0
+    for selection in batch.selections:
+        ends = _selection_ends(selection)
+        try:
+            match = _match(state.index, selection)
+        except ValueError:
+            match = None
+        if match is None:
+            results.append({"found": False})
+            events.append((*ends, -1, 0))
+            continue
+        bit = 1 << match.ordinal
+        new = not found & bit
+        if new:
+            new_words += 1
+            new_cells += _selected_cells(selection)
+        results.append({"found": True, "new": new, **match._asdict()})
+        events.append((*ends, match.ordinal, replay.FOUND | (replay.NEW if new else 0)))
+        found |= bit
+    return results, events, found, new_words, new_cells
+
+
+def _submit(db: Session, link_code: str, participant_id: int, batch: SelectionBatch) -> dict:
+    """Check every selection of ``batch``, then record the finds in one update.
+
+    Selections that are not a word, or fall outside the grid, are reported
+    as not found rather than failing the whole batch.
+    """
+    state = _hot_game(db, link_code)
+    if state.mode == "boggle":
+        raise HTTPException(status_code=409, detail="Boggle games take traced guesses")
+    participant = crud.get_participant(db, state.id, participant_id)
+    if participant is None:
+        raise HTTPException(status_code=404, detail="participant not found")
+    for _ in range(2):
+        results, events, found, new_words, new_cells = _check_selections(
+            state, participant.found_words, batch
+        )
+        try:
+            crud.record_found(db, participant, found, state.word_count, state.version)
+            break
+        except crud.StaleGameError:
+            # Edited through another process since this one cached the game:
+            # check the batch again against the current words.
+            game_cache.invalidate(link_code)
+            state = _hot_game(db, link_code)
+    else:
+        raise HTTPException(status_code=409, detail="the game's words changed, try again")
+    replay.append_events(state.id, participant.id, events)
+    if new_words:
+        analyzer.submit(
+            FindEvent(
+                participant.id,
+                time.time(),
+                crud.as_utc(participant.created_at).timestamp(),
+                new_words,
+                new_cells,
+            )
+        )
+    return {"results": results, "participant": participant}
+
+
+def _selection_ends(selection: Selection) -> tuple[tuple[int, int], tuple[int, int]]:
+    if selection.cells is not None:
+        return selection.cells[0], selection.cells[-1]
+    return selection.start, selection.end
+
+
+def _selected_cells(selection: Selection) -> int:
+    if selection.cells is not None:
+        return len(selection.cells)
+    (r0, c0), (r1, c1) = selection.start, selection.end
+    return max(abs(r1 - r0), abs(c1 - c0)) + 1
+
+
+@router.post(
+    "/{link_code}/participants/{participant_id}/selections", response_model=SubmissionResult
+)
+def submit_selections(
+    link_code: str, participant_id: int, batch: SelectionBatch, db: Session = Depends(get_db)
+):
+    """Submit several found words at once; progress is written once per batch."""
+    return _submit(db, link_code, participant_id, batch)
+
+
+@router.post(
+    "/{link_code}/participants/{participant_id}/boggle/guesses",
+    response_model=BoggleGuessResult,
+)
+def submit_boggle_guess(
+    link_code: str, participant_id: int, guess: BoggleGuess, db: Session = Depends(get_db)
+):
+    """Score a path traced through adjacent cells if it spells an answer.
+
+    The letters are read from the traced cells, so a guess is only valid
+    when the player actually found the word on the board; each word scores
+    once per participant, more for longer words.
+    """
+    state = _hot_game(db, link_code)
+    if state.mode != "boggle":
+        raise HTTPException(status_code=409, detail="not a Boggle game")
+    participant = crud.get_participant(db, state.id, participant_id)
+    if participant is None:
+        raise HTTPException(status_code=404, detail="participant not found")
+    try:
+        word = traced_word(state.payload["grid"], guess.cells)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if word not in state.index.answers:
+        return {"word": word, "valid": False, "participant": participant}
+    points = word_points(word)
+    new = crud.record_boggle_word(db, participant, word, points)
+    if new:
+        analyzer.submit(
+            FindEvent(
+                participant.id,
+                time.time(),
+                crud.as_utc(participant.created_at).timestamp(),
+                1,
+                len(guess.cells),
+            )
+        )
+    return {
+        "word": word,
+        "valid": True,
+        "new": new,
+        "points": points if new else 0,
+        "participant": participant,
+    }
+
+
+def _submit_in_session(link_code: str, participant_id: int, batch: SelectionBatch) -> dict:
+    with SessionLocal() as db:
+        result = _submit(db, link_code, participant_id, batch)
+        return SubmissionResult.model_validate(result, from_attributes=True).model_dump()
+
+
+@router.websocket("/{link_code}/participants/{participant_id}/ws")
+async def submission_socket(websocket: WebSocket, link_code: str, participant_id: int):
+    """Same as :func:`submit_selections`, one ``SelectionBatch`` per message.
+
+    Each message is answered with a ``SubmissionResult``, or ``{"error": ...}``
+    when it is malformed or refused (say, because the game's words changed
+    mid-check).  The socket is closed only if the game or participant does
+    not exist.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                batch = SelectionBatch.model_validate_json(message)
+            except ValidationError as exc:
+                errors = exc.errors(include_url=False, include_context=False)
+                await websocket.send_json({"error": errors})
+                continue
+            try:
+                result = await run_in_threadpool(
+                    _submit_in_session, link_code, participant_id, batch
+                )
+            except HTTPException as exc:
+                await websocket.send_json({"error": exc.detail})
+                if exc.status_code == 404:
+                    await websocket.close(code=1008)
+                    return
+                continue
+            await websocket.send_json(result)
+    except WebSocketDisconnect:
+        return
+
+
+def _stream_replay(reader: replay.ReplayReader, participant_id: int | None) -> Iterator[bytes]:
+    yield json.dumps({"started_at": reader.started_at, "events": len(reader)}).encode() + b"\n"
+    for event in reader.iter_events(participant_id):
+        yield json.dumps(event).encode() + b"\n"
+
+
+@router.get("/{link_code}/replay")
+def read_replay(
+    link_code: str, participant_id: int | None = None, db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """Every selection of the session in order, as NDJSON after a header line.
+
+    ``participant_id`` narrows the replay to one player.
+    """
+    path = replay.log_path(_hot_game(db, link_code).id)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="no replay recorded for this game")
+    reader = replay.ReplayReader(path)
+    return StreamingResponse(
+        _stream_replay(reader, participant_id), media_type="application/x-ndjson"
+    )
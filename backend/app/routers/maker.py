@@ -0,0 +1,131 @@
+"""Word Search Maker endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator, Iterator
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from .. import crud
+from ..config import settings
+from ..database import SessionLocal
+from ..maker import ALPHABETS
+from ..maker.batch import generate_puzzle, get_executor
+from ..maker.cache import puzzle_cache, spec_key
+from ..maker.mega import generate_bands
+from ..schemas import CacheStats, GameOut, MakerBatch, MakerSpec, MegaSpec, PuzzleOut
+
+router = APIRouter(prefix="/maker", tags=["maker"])
+
+
+async def _generate(spec: MakerSpec) -> dict:
+    data = spec.model_dump()
+    try:
+        key = spec_key(data)
+    except ValueError as exc:
+        # A word outside the alphabet, reported like any other failed spec.
+        return {"title": spec.title, "error": str(exc)}
+    if key is not None:
+        cached = await run_in_threadpool(puzzle_cache.get, key)
+        if cached is not None:
+            return {**cached, "title": spec.title}
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(get_executor(), generate_puzzle, data)
+    if key is not None and "error" not in result and not result["unplaced"]:
+        payload = {k: v for k, v in result.items() if k != "title"}
+        await run_in_threadpool(puzzle_cache.put, key, payload)
+    return result
+
+
+@router.post("/puzzles", response_model=PuzzleOut)
+async def create_puzzle(spec: MakerSpec) -> dict:
+    result = await _generate(spec)
+    if "error" in result:
+        raise HTTPException(status_code=422, detail=result["error"])
+    return result
+
+
+def _store_game(puzzle: dict, title: str) -> dict:
+    with SessionLocal() as db:
+        game = crud.create_game(db, puzzle, title=title)
+        return GameOut.model_validate(game).model_dump()
+
+
+async def _stream_batch(specs: list[MakerSpec]) -> AsyncIterator[bytes]:
+    async def run(index: int, spec: MakerSpec) -> dict:
+        result = await _generate(spec)
+        if "error" not in result:
+            title = spec.title or f"Puzzle {index + 1}"
+            try:
+                result = await run_in_threadpool(_store_game, result, title)
+            except ValueError as exc:
+                result = {"title": spec.title, "error": str(exc)}
+        return {"index": index, **result}
+
+    tasks = [asyncio.ensure_future(run(i, spec)) for i, spec in enumerate(specs)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield json.dumps(await finished, ensure_ascii=False).encode() + b"\n"
+    finally:
+        # The client went away or we are done: drop work that has not started.
+        for task in tasks:
+            task.cancel()
+
+
+@router.post("/batch")
+async def create_batch(batch: MakerBatch) -> StreamingResponse:
+    """Generate many puzzles in parallel, streaming each stored game as NDJSON.
+
+    Every generated puzzle is saved as a classic game (titled ``Puzzle n``
+    when its spec has no title), so each line is a ``GameOut`` with the
+    ``link_code`` to hand out.  Lines arrive in completion order; ``index``
+    refers back to the request.  A spec that cannot be generated or stored
+    yields a line with an ``error`` field.
+    """
+    if len(batch.specs) > settings.maker_batch_limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"at most {settings.maker_batch_limit} specs per batch",
+        )
+    return StreamingResponse(_stream_batch(batch.specs), media_type="application/x-ndjson")
+
+
+def _stream_mega(spec: MegaSpec) -> Iterator[bytes]:
+    yield json.dumps({"rows": spec.rows, "cols": spec.cols}).encode() + b"\n"
+    bands = generate_bands(
+        spec.words, spec.rows, spec.cols, spec.directions, spec.seed, alphabet=spec.alphabet
+    )
+    for band in bands:
+        if "words" in band:
+            band["words"] = [
+                {"word": p.word, "row": p.row, "col": p.col, "direction": p.direction}
+                for p in band["words"]
+            ]
+        yield json.dumps(band, ensure_ascii=False).encode() + b"\n"
+
+
+@router.post("/mega")
+def create_mega(spec: MegaSpec) -> StreamingResponse:
+    """Generate a grid of up to 2000x2000, streaming NDJSON band by band.
+
+    The first line holds the grid size, then each band contributes a line
+    with its ``start`` row, finished ``rows`` and placed ``words``; the last
+    line lists ``unplaced`` words.  Generation runs in a worker thread while
+    the response streams.
+    """
+    try:
+        words = [ALPHABETS[spec.alphabet].normalize(w) for w in spec.words]
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if max(len(w) for w in words) > max(spec.rows, spec.cols):
+        raise HTTPException(status_code=422, detail="words longer than the grid")
+    return StreamingResponse(_stream_mega(spec), media_type="application/x-ndjson")
+
+
+@router.get("/cache/stats", response_model=CacheStats)
+def cache_stats() -> dict:
+    return puzzle_cache.stats()
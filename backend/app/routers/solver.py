@@ -0,0 +1,56 @@
+"""Grid solver endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from ..config import settings
+from ..maker.batch import get_executor
+from ..schemas import SolveBatch, SolveRequest, SolveResult
+from ..solver import solve, solve_many
+
+router = APIRouter(prefix="/solver", tags=["solver"])
+
+# Grids sent to a worker process per task; amortizes pickling overhead.
+_CHUNK_SIZE = 200
+
+
+@router.post("/solve", response_model=SolveResult)
+def solve_one(request: SolveRequest) -> dict:
+    try:
+        return solve(request.grid, request.words)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+async def _stream_batch(puzzles: list[dict]) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    chunks = [puzzles[i : i + _CHUNK_SIZE] for i in range(0, len(puzzles), _CHUNK_SIZE)]
+    futures = [loop.run_in_executor(executor, solve_many, chunk) for chunk in chunks]
+    try:
+        index = 0
+        for future in futures:
+            for result in await future:
+                yield json.dumps({"index": index, **result}, ensure_ascii=False).encode() + b"\n"
+                index += 1
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+@router.post("/batch")
+async def solve_batch(batch: SolveBatch) -> StreamingResponse:
+    """Solve many grids across the worker pool, streaming NDJSON in request order."""
+    if len(batch.puzzles) > settings.solver_batch_limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"at most {settings.solver_batch_limit} puzzles per batch",
+        )
+    puzzles = [p.model_dump() for p in batch.puzzles]
+    return StreamingResponse(_stream_batch(puzzles), media_type="application/x-ndjson")
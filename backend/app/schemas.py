@@ -0,0 +1,320 @@
+"""Pydantic request and response models."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from .maker import DIRECTION_NAMES
+from .maker.paths import decode_path
+from .maker.shapes import SHAPES
+from .maker.themes import DIFFICULTIES, QUICK_PLAY_SIZES, THEMES
+
+
+def _check_directions(value: list[str]) -> list[str]:
+    unknown = [d for d in value if d not in DIRECTION_NAMES]
+    if unknown:
+        raise ValueError(f"unknown directions: {', '.join(unknown)}")
+    return value
+
+
+class MakerSpec(BaseModel):
+    title: str | None = None
+    words: list[str] = Field(min_length=1)
+    size: int = Field(ge=2, le=100)
+    directions: list[str] = Field(default_factory=lambda: list(DIRECTION_NAMES), min_length=1)
+    seed: int | None = None
+    strategy: Literal["random", "backtrack", "compact", "snake"] = "random"
+    # Adjacency of snaking words: 4 (no diagonal steps) or 8.
+    neighbors: Literal[4, 8] = 8
+    # Anytime generation: return the best layout found within this budget.
+    time_budget_ms: int | None = Field(default=None, ge=1, le=60_000)
+    alphabet: Literal["latin", "hangul", "jamo"] = "latin"
+    # A named outline, or explicit rows of "#" (usable) and "." (blank) cells.
+    shape: str | None = None
+    shape_bitmap: list[str] | None = None
+    # Hidden-message mode: the uncovered cells spell this, row by row.
+    message: str | None = Field(default=None, min_length=1, max_length=2_000)
+
+    _known_directions = field_validator("directions")(_check_directions)
+
+    @field_validator("shape")
+    @classmethod
+    def _known_shape(cls, value: str | None) -> str | None:
+        if value is not None and value not in SHAPES:
+            raise ValueError(f"unknown shape: {value}")
+        return value
+
+    @model_validator(mode="after")
+    def _bitmap_fits(self) -> MakerSpec:
+        if self.shape_bitmap is None:
+            return self
+        if self.shape is not None:
+            raise ValueError("give either shape or shape_bitmap, not both")
+        if len(self.shape_bitmap) != self.size or any(
+            len(row) != self.size for row in self.shape_bitmap
+        ):
+            raise ValueError(f"shape_bitmap must be {self.size} rows of {self.size} cells")
+        if self.strategy == "compact":
+            raise ValueError("the compact strategy cannot be used with shape_bitmap")
+        return self
+
+
+class GameCreate(MakerSpec):
+    title: str = Field(min_length=1, max_length=200)
+    description: str | None = None
+    mode: Literal["classic", "boggle"] = "classic"
+
+
+class MegaSpec(BaseModel):
+    words: list[str] = Field(min_length=1, max_length=50_000)
+    rows: int = Field(ge=2, le=2000)
+    cols: int = Field(ge=2, le=2000)
+    directions: list[str] = Field(default_factory=lambda: list(DIRECTION_NAMES), min_length=1)
+    seed: int | None = None
+    alphabet: Literal["latin", "hangul", "jamo"] = "latin"
+
+    _known_directions = field_validator("directions")(_check_directions)
+
+
+class MakerBatch(BaseModel):
+    specs: list[MakerSpec] = Field(min_length=1)
+
+
+class PlacedWord(BaseModel):
+    word: str
+    row: int
+    col: int
+    direction: str
+    # Packed start/direction/length, see app.maker.positions; null for
+    # snaking words, whose flat cell indices (row * cols + col) are in path.
+    position_data: int | None
+    path: list[int] | None = None
+
+
+class PuzzleOut(BaseModel):
+    title: str | None = None
+    rows: int
+    cols: int
+    grid: list[str]
+    seed: int | None = None
+    difficulty: float | None = None
+    words: list[PlacedWord]
+    unplaced: list[str] = []
+    # Usable cells of a shaped grid, one bit per cell, base64 (app.maker.shapes).
+    mask: str | None = None
+    message: str | None = None
+
+
+class CacheStats(BaseModel):
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_size: int
+    memory_maxsize: int
+
+
+class GameWordOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    word: str
+    # Packed start/direction/length, see app.maker.positions.
+    position_data: int | None
+    # Flat cell indices of a snaking word.
+    path: list[int] | None = None
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _split_path(cls, value: str | list[int] | None) -> list[int] | None:
+        return list(decode_path(value)) if isinstance(value, str) else value
+
+
+class GameOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    description: str | None = None
+    link_code: str
+    rows: int
+    cols: int
+    difficulty: float | None = None
+    mode: str = "classic"
+    grid: list[str]
+    words: list[GameWordOut]
+
+    @field_validator("grid", mode="before")
+    @classmethod
+    def _split_grid(cls, value: str | list[str]) -> list[str]:
+        return value.split("\n") if isinstance(value, str) else value
+
+
+class Selection(BaseModel):
+    # A straight drag as its [row, col] end cells, or every selected cell in
+    # order (needed for snaking words).
+    start: tuple[int, int] | None = None
+    end: tuple[int, int] | None = None
+    cells: list[tuple[int, int]] | None = Field(default=None, min_length=1, max_length=10_000)
+
+    @model_validator(mode="after")
+    def _one_form(self) -> Selection:
+        ends = self.start is not None and self.end is not None
+        if ends == (self.cells is not None) or (self.start is None) != (self.end is None):
+            raise ValueError("give either start and end, or cells")
+        return self
+
+
+class SelectionResult(BaseModel):
+    found: bool
+    word_id: int | None = None
+    word: str | None = None
+    # In a submission: found by this participant for the first time.
+    new: bool = False
+
+
+class SelectionBatch(BaseModel):
+    selections: list[Selection] = Field(min_length=1, max_length=500)
+
+
+class BoggleGuess(BaseModel):
+    # The traced cells as [row, col], in order.
+    cells: list[tuple[int, int]] = Field(min_length=1, max_length=100)
+
+
+class ParticipantJoin(BaseModel):
+    username: str = Field(min_length=1, max_length=50)
+
+
+class ParticipantOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    game_id: int
+    username: str
+    score: int
+    # Bit i set once the game's i-th word is found (app.progress).
+    found_words: int
+    completion_time: float | None = None
+    flagged: str | None = None
+
+
+class SubmissionResult(BaseModel):
+    results: list[SelectionResult]
+    participant: ParticipantOut
+
+
+class BoggleGuessResult(BaseModel):
+    word: str
+    valid: bool
+    # First time this participant traced the word, and what it scored.
+    new: bool = False
+    points: int = 0
+    participant: ParticipantOut
+
+
+class Hint(BaseModel):
+    kind: Literal["quadrant", "direction", "first_cell"]
+    value: str | list[int]
+
+
+class HintsOut(BaseModel):
+    word_id: int
+    hints: list[Hint]
+    # Hints left after these.
+    remaining: int
+
+
+class GameSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    link_code: str
+    rows: int
+    cols: int
+    difficulty: float | None = None
+    created_at: datetime
+
+
+class GameWordsUpdate(BaseModel):
+    words: list[str] = Field(min_length=1)
+    # Directions for newly added words; defaults to those already in the game.
+    directions: list[str] | None = None
+    seed: int | None = None
+
+    @field_validator("directions")
+    @classmethod
+    def _known_directions(cls, value: list[str] | None) -> list[str] | None:
+        return _check_directions(value) if value is not None else None
+
+
+class QuickPlayRequest(BaseModel):
+    theme: str = "animals"
+    size: int = 15
+    difficulty: str = "medium"
+    mode: Literal["classic", "boggle"] = "classic"
+
+    @field_validator("theme")
+    @classmethod
+    def _known_theme(cls, value: str) -> str:
+        if value not in THEMES:
+            raise ValueError(f"theme must be one of: {', '.join(THEMES)}")
+        return value
+
+    @field_validator("size")
+    @classmethod
+    def _known_size(cls, value: int) -> int:
+        if value not in QUICK_PLAY_SIZES:
+            raise ValueError(f"size must be one of: {', '.join(map(str, QUICK_PLAY_SIZES))}")
+        return value
+
+    @field_validator("difficulty")
+    @classmethod
+    def _known_difficulty(cls, value: str) -> str:
+        if value not in DIFFICULTIES:
+            raise ValueError(f"difficulty must be one of: {', '.join(DIFFICULTIES)}")
+        return value
+
+
+class InventoryBucket(BaseModel):
+    theme: str
+    size: int
+    difficulty: str
+    depth: int
+
+
+class SolveRequest(BaseModel):
+    grid: list[str] = Field(min_length=1)
+    words: list[str] = Field(min_length=1)
+
+    @field_validator("grid")
+    @classmethod
+    def _rectangular(cls, value: list[str]) -> list[str]:
+        if any(len(row) != len(value[0]) for row in value) or not value[0]:
+            raise ValueError("grid rows must be non-empty and all the same length")
+        return value
+
+
+class SolveBatch(BaseModel):
+    puzzles: list[SolveRequest] = Field(min_length=1)
+
+
+class WordOccurrence(BaseModel):
+    row: int
+    col: int
+    direction: str
+    position_data: int
+
+
+class SolvedWord(BaseModel):
+    word: str
+    occurrences: list[WordOccurrence]
+
+
+class SolveResult(BaseModel):
+    words: list[SolvedWord]
+    missing: list[str]
+    ambiguous: list[str]
@@ -0,0 +1,79 @@
+"""Answer checks: map a player's selection to the word it spells.
+
+Each game gets a :class:`SelectionIndex` with two hash maps.  A straight
+word is fully described by its end cells, which come out of its packed
+``position_data`` by arithmetic (:func:`~app.maker.positions.position_endpoints`),
+so the first maps ``(start, end)`` cell pairs, in both orientations, to the
+word and straight words are never expanded into cells.  A selection given
+cell by cell that runs in a straight line is checked against the same map,
+after verifying each step.  The second map is keyed by the exact cells of
+every snaking word, read in either direction: ``O(path length)``.  Boggle
+games also keep their unpacked answer set for guess checks.
+
+Indexes live with the rest of a hot game in :mod:`app.game_cache`.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence
+
+from .boggle import unpack_words
+from .maker.paths import decode_path
+from .maker.grid import DIRECTIONS
+from .maker.positions import position_endpoints
+from .models import Game
+
+
+class Match(NamedTuple):
+    word_id: int
+    word: str
+    # Position in Game.words, the word's bit in participant progress.
+    ordinal: int
+
+
+_STEPS = frozenset(DIRECTIONS.values())
+
+
+def _straight(cells: Sequence[tuple[int, int]]) -> bool:
+    """Whether ``cells`` are one unit step apart, all in the same direction."""
+    steps = {(r1 - r0, c1 - c0) for (r0, c0), (r1, c1) in zip(cells, cells[1:])}
+    return len(steps) <= 1 and steps <= _STEPS
+
+
+class SelectionIndex:
+    def __init__(self, game: Game) -> None:
+        self.rows = game.rows
+        self.cols = game.cols
+        self._paths: dict[tuple[int, ...], Match] = {}
+        self._endpoints: dict[tuple[int, int], Match] = {}
+        for ordinal, w in enumerate(game.words):
+            match = Match(w.id, w.word, ordinal)
+            if w.path is not None:
+                cells = decode_path(w.path)
+                self._paths[cells] = match
+                self._paths[cells[::-1]] = match
+            else:
+                start, end = (r * game.cols + c for r, c in position_endpoints(w.position_data))
+                self._endpoints[start, end] = match
+                self._endpoints[end, start] = match
+        self.answers = (
+            unpack_words(game.boggle_words) if game.boggle_words is not None else frozenset()
+        )
+
+    def _flat(self, row: int, col: int) -> int:
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"cell ({row}, {col}) is outside the grid")
+        return row * self.cols + col
+
+    def lookup(self, cells: Sequence[tuple[int, int]]) -> Match | None:
+        """The word covering exactly ``cells`` (``(row, col)`` pairs), if any."""
+        flat = tuple(self._flat(row, col) for row, col in cells)
+        if _straight(cells):
+            match = self._endpoints.get((flat[0], flat[-1]))
+            if match is not None:
+                return match
+        return self._paths.get(flat)
+
+    def lookup_endpoints(self, start: tuple[int, int], end: tuple[int, int]) -> Match | None:
+        """The straight word running from ``start`` to ``end``, either way round."""
+        return self._endpoints.get((self._flat(*start), self._flat(*end)))
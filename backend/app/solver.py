@@ -0,0 +1,82 @@
+"""Find every occurrence of a word list in an arbitrary grid.
+
+Used to validate uploaded or hand-edited puzzles: each line of the grid is
+read once by an Aho-Corasick automaton over all words and their reverses,
+so the cost does not grow with the number of words.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .maker import normalize_word
+from .maker.grid import Placement, encode_word
+from .maker.positions import encode_position
+from .maker.scan import WordScanner, grid_lines
+
+
+def grid_cells(grid: Sequence[str]) -> np.ndarray:
+    """Encode grid rows into a flat code point buffer; rows must be equal length.
+
+    Rows are upper-cased one by one, and a row whose length that changes
+    (``"ß"`` becomes ``"SS"``) is rejected rather than shifting its cells.
+    """
+    if not grid or any(len(row) != len(grid[0]) for row in grid):
+        raise ValueError("grid rows must all have the same length")
+    rows = [row.upper() for row in grid]
+    for number, (row, upper) in enumerate(zip(grid, rows)):
+        if len(upper) != len(row):
+            raise ValueError(f"row {number} changes length when upper-cased")
+    return encode_word("".join(rows))
+
+
+def solve(grid: Sequence[str], words: Sequence[str]) -> dict:
+    """Locate ``words`` in ``grid`` in all 8 directions.
+
+    Returns every occurrence per word, plus the words that are ``missing``
+    and those found more than once (``ambiguous``).  Readings over the same
+    cells count once: a one-letter word matches in every direction, and a
+    palindrome both ways.
+    """
+    cells = grid_cells(grid)
+    rows, cols = len(grid), len(grid[0])
+    targets = [w for w in dict.fromkeys(normalize_word(w) for w in words) if w]
+    found: dict[str, list[dict]] = {word: [] for word in targets}
+    seen: set[tuple[str, frozenset[tuple[int, int]]]] = set()
+    if targets:
+        for occurrence in WordScanner(targets).scan(cells, cols, grid_lines(rows, cols)):
+            placement = Placement(
+                occurrence.word, occurrence.row, occurrence.col, occurrence.direction
+            )
+            key = (occurrence.word, frozenset(placement.coordinates()))
+            if key in seen:
+                continue
+            seen.add(key)
+            found[occurrence.word].append(
+                {
+                    "row": occurrence.row,
+                    "col": occurrence.col,
+                    "direction": occurrence.direction,
+                    "position_data": encode_position(
+                        occurrence.row, occurrence.col, occurrence.direction, len(occurrence.word)
+                    ),
+                }
+            )
+    return {
+        "words": [{"word": word, "occurrences": found[word]} for word in targets],
+        "missing": [word for word in targets if not found[word]],
+        "ambiguous": [word for word in targets if len(found[word]) > 1],
+    }
+
+
+def solve_many(puzzles: Sequence[dict]) -> list[dict]:
+    """Solve a chunk of ``{"grid", "words"}`` puzzles; runs in a worker process."""
+    results = []
+    for puzzle in puzzles:
+        try:
+            results.append(solve(puzzle["grid"], puzzle["words"]))
+        except ValueError as exc:
+            results.append({"error": str(exc)})
+    return results
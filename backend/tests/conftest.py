@@ -0,0 +1,20 @@
+import os
+import tempfile
+
+# Point the app at throwaway storage before any app module reads settings.
+_scratch = tempfile.mkdtemp(prefix="wordsearch-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch}/wordsearch.db"
+os.environ["REPLAY_DIR"] = os.path.join(_scratch, "replays")
+os.environ["INVENTORY_TARGET_DEPTH"] = "0"
+os.environ["MAKER_WORKERS"] = "2"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,5 @@
+from app.maker.alphabet import COMMON_SYLLABLES
+
+
+def test_common_syllables_are_listed_once():
+    assert len(set(COMMON_SYLLABLES)) == len(COMMON_SYLLABLES)
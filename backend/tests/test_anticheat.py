@@ -0,0 +1,48 @@
+import random
+
+from app.anticheat import FindEvent, PlayAnalyzer, PlayStats
+
+
+def stream(participant_id, gaps, words=1, cells=5, joined_at=1_000.0):
+    at = joined_at
+    for gap in gaps:
+        at += gap
+        yield FindEvent(participant_id, at, joined_at, words, cells)
+
+
+def verdicts(analyzer, events):
+    return [reason for reason in map(analyzer.observe, events) if reason is not None]
+
+
+def test_forty_words_in_three_seconds_is_flagged_once():
+    events = stream(1, [0.3] * 10, words=4, cells=20)
+    assert verdicts(PlayAnalyzer(10), events) == ["too_fast"]
+
+
+def test_timer_even_submissions_are_too_regular():
+    stats = PlayStats(joined_at=0.0)
+    for event in stream(2, [10.0] * 9, joined_at=0.0):
+        stats.add(event)
+    assert stats.verdict() == "too_regular"
+    assert verdicts(PlayAnalyzer(10), stream(3, [10.0] * 30)) == ["too_regular"]
+
+
+def test_irregular_human_pace_is_never_flagged():
+    rng = random.Random(0)
+    for participant in range(20):
+        gaps = [rng.uniform(2, 40) for _ in range(60)]
+        events = stream(participant, gaps, cells=rng.randint(3, 9))
+        assert verdicts(PlayAnalyzer(100), events) == []
+
+
+def test_least_recently_active_participants_are_evicted():
+    analyzer = PlayAnalyzer(max_tracked=3)
+    for participant in (1, 2, 3):
+        analyzer.observe(FindEvent(participant, 10.0, 0.0, 1, 5))
+    analyzer.observe(FindEvent(1, 20.0, 0.0, 1, 5))
+    analyzer.observe(FindEvent(4, 20.0, 0.0, 1, 5))
+    assert list(analyzer._stats) == [3, 1, 4]
+    assert analyzer._stats[1].words == 2
+    analyzer.observe(FindEvent(2, 30.0, 0.0, 1, 5))
+    assert list(analyzer._stats) == [1, 4, 2]
+    assert analyzer._stats[2].words == 1
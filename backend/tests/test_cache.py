@@ -0,0 +1,45 @@
+from app.maker.cache import PuzzleCache, spec_key
+
+SPEC = {"words": ["cat", "Dog", "bird"], "size": 8, "directions": ["down", "right"], "seed": 3}
+
+
+def test_spec_key_ignores_word_order_case_and_direction_order():
+    same = {**SPEC, "words": ["BIRD", "cat", "dog", "Cat"], "directions": ["right", "down"]}
+    assert spec_key(SPEC) == spec_key(same)
+    assert spec_key(SPEC) != spec_key({**SPEC, "seed": 4})
+    assert spec_key(SPEC) != spec_key({**SPEC, "strategy": "backtrack"})
+
+
+def test_unseeded_specs_have_no_key():
+    assert spec_key({**SPEC, "seed": None}) is None
+
+
+def test_memory_is_an_lru_and_disk_hits_are_promoted(client):
+    # ``client`` starts the app, which migrates the database.
+    cache = PuzzleCache(maxsize=2)
+    for key in ("lru-a", "lru-b", "lru-c"):
+        cache.put(key, {"key": key})
+    assert list(cache._memory) == ["lru-b", "lru-c"]
+
+    assert cache.get("lru-a") == {"key": "lru-a"}
+    assert list(cache._memory) == ["lru-c", "lru-a"]
+    assert cache.get("lru-a") == {"key": "lru-a"}
+    assert cache.get("lru-missing") is None
+    assert cache.stats() == {
+        "memory_hits": 1,
+        "disk_hits": 1,
+        "misses": 1,
+        "memory_size": 2,
+        "memory_maxsize": 2,
+    }
+
+
+def test_stats_endpoint_counts_cached_generation(client):
+    spec = {"words": ["ORBIT", "COMET"], "size": 7, "seed": 987}
+    before = client.get("/maker/cache/stats").json()
+    first = client.post("/maker/puzzles", json=spec).json()
+    again = client.post("/maker/puzzles", json={**spec, "words": ["comet", "orbit"]}).json()
+    after = client.get("/maker/cache/stats").json()
+    assert again == first
+    assert after["misses"] - before["misses"] == 1
+    assert after["memory_hits"] - before["memory_hits"] == 1
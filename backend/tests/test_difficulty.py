@@ -0,0 +1,34 @@
+import pytest
+
+from app.maker import DIRECTION_NAMES, Maker
+from app.maker.difficulty import WEIGHTS, difficulty_components
+
+from .test_maker import ANIMALS
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_two_directions_score_easier_than_all_eight(seed):
+    easy = Maker(ANIMALS, 12, directions=["right", "down"], seed=seed).generate()
+    hard = Maker(ANIMALS, 12, directions=DIRECTION_NAMES, seed=seed).generate()
+    components = difficulty_components(easy.grid, easy.placements)
+    assert set(components) == set(WEIGHTS)
+    assert all(0 <= value <= 1 for value in components.values())
+    assert components["reversed"] == 0
+    # Two directions carry at most log(2) of the log(8) entropy.
+    assert components["direction_mix"] <= 1 / 3 + 1e-9
+    assert easy.difficulty < hard.difficulty
+
+
+def test_games_filter_and_sort_by_difficulty(client):
+    for seed, directions in enumerate([["right"], ["right", "down"], list(DIRECTION_NAMES)]):
+        spec = {"title": "Graded", "words": ANIMALS, "size": 12, "seed": seed}
+        client.post("/games", json={**spec, "directions": directions})
+    games = client.get("/games", params={"sort": "difficulty", "limit": 200}).json()
+    scores = [g["difficulty"] for g in games]
+    assert scores == sorted(scores)
+    middle = scores[len(scores) // 2]
+    harder = client.get("/games", params={"min_difficulty": middle, "limit": 200}).json()
+    assert harder and all(g["difficulty"] >= middle for g in harder)
+    assert len(harder) < len(games)
+    descending = client.get("/games", params={"sort": "-difficulty", "limit": 200}).json()
+    assert [g["difficulty"] for g in descending] == sorted(scores, reverse=True)
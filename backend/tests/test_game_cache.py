@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from app.database import SessionLocal
+from app.game_cache import GameCache, game_cache
+
+SPEC = {"title": "Cached", "words": ["LION", "BEAR", "WOLF"], "size": 8, "seed": 5}
+
+
+def test_entries_expire_and_the_least_recently_used_is_evicted(client, monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr("app.game_cache.time", SimpleNamespace(monotonic=lambda: clock.now))
+    codes = [client.post("/games", json=SPEC).json()["link_code"] for _ in range(3)]
+    cache = GameCache(maxsize=2, ttl=10.0)
+    with SessionLocal() as db:
+        first = cache.get(db, codes[0])
+        cache.get(db, codes[1])
+        assert cache.get(db, codes[0]) is first
+        cache.get(db, codes[2])
+        assert list(cache._games) == [codes[0], codes[2]]
+
+        clock.now = 9.0
+        assert cache.get(db, codes[0]) is first
+        clock.now = 10.0
+        assert cache.get(db, codes[0]) is not first
+        assert cache.get(db, "no-such-game") is None
+        assert "no-such-game" not in cache._games
+
+
+def test_editing_words_invalidates_the_entry(client):
+    code = client.post("/games", json=SPEC).json()["link_code"]
+    with SessionLocal() as db:
+        before = game_cache.get(db, code)
+    client.patch(f"/games/{code}/words", json={"words": ["BEAR", "WOLF", "DEER"]})
+    assert code not in game_cache._games
+    with SessionLocal() as db:
+        after = game_cache.get(db, code)
+    assert after.version == before.version + 1
+    assert [w["word"] for w in after.payload["words"]] == ["BEAR", "WOLF", "DEER"]
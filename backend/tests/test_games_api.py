@@ -0,0 +1,182 @@
+import pytest
+from fastapi import WebSocketDisconnect
+
+from app.database import SessionLocal
+from app.game_cache import game_cache
+from app.maker.grid import Placement
+from app.maker.positions import decode_position
+from app.progress import MAX_WORDS
+
+from .test_placer import random_words
+
+
+def word_ends(word):
+    cells = Placement(word["word"], *decode_position(word["position_data"])[:3]).coordinates()
+    return {"start": cells[0], "end": cells[-1]}
+
+
+def test_quick_play_stores_a_playable_game(client):
+    game = client.post("/games/quick-play", json={"size": 10, "difficulty": "easy"}).json()
+    assert game["words"]
+    assert client.get(f"/games/{game['link_code']}").json() == game
+
+
+def test_snaking_game_is_stored_and_checked_by_path(client):
+    spec = {
+        "title": "Snakes",
+        "words": ["PYTHON", "COBRA", "VIPER", "MAMBA"],
+        "size": 6,
+        "seed": 3,
+        "strategy": "snake",
+    }
+    response = client.post("/games", json=spec)
+    assert response.status_code == 201, response.text
+    game = response.json()
+    code = game["link_code"]
+    assert {w["word"] for w in game["words"]} == set(spec["words"])
+    for word in game["words"]:
+        assert word["position_data"] is None
+        cells = [divmod(i, game["cols"]) for i in word["path"]]
+        assert "".join(game["grid"][r][c] for r, c in cells) == word["word"]
+        result = client.post(f"/games/{code}/selections", json={"cells": cells}).json()
+        assert result == {"found": True, "word_id": word["id"], "word": word["word"], "new": False}
+        backwards = client.post(f"/games/{code}/selections", json={"cells": cells[::-1]})
+        assert backwards.json()["found"]
+    edit = client.patch(f"/games/{code}/words", json={"words": ["PYTHON"]})
+    assert edit.status_code == 422
+
+
+def test_create_game_rejects_a_spec_that_cannot_be_generated(client):
+    spec = {"title": "Too long", "words": ["ELEPHANT"], "size": 4}
+    assert client.post("/games", json=spec).status_code == 422
+
+
+def test_socket_answers_a_malformed_message_and_keeps_going(client):
+    game = client.post("/games/quick-play", json={"size": 10, "difficulty": "easy"}).json()
+    code = game["link_code"]
+    player = client.post(f"/games/{code}/participants", json={"username": "ws"}).json()
+    word = game["words"][0]
+    with client.websocket_connect(f"/games/{code}/participants/{player['id']}/ws") as socket:
+        socket.send_text("not json")
+        assert "error" in socket.receive_json()
+        socket.send_json({"selections": []})
+        assert "error" in socket.receive_json()
+        socket.send_json({"selections": [word_ends(word)]})
+        result = socket.receive_json()
+    assert result["results"] == [
+        {"found": True, "word_id": word["id"], "word": word["word"], "new": True}
+    ]
+
+
+def test_boggle_scores_traced_words_once_per_player(client):
+    spec = {"title": "Zoo", "words": ["TIGER", "ZEBRA"], "size": 6, "seed": 2, "mode": "boggle"}
+    game = client.post("/games", json=spec).json()
+    code = game["link_code"]
+    player = client.post(f"/games/{code}/participants", json={"username": "tracer"}).json()
+    guesses = f"/games/{code}/participants/{player['id']}/boggle/guesses"
+    tiger = next(w for w in game["words"] if w["word"] == "TIGER")
+    cells = Placement("TIGER", *decode_position(tiger["position_data"])[:3]).coordinates()
+
+    first = client.post(guesses, json={"cells": cells}).json()
+    outcome = (first["word"], first["valid"], first["new"], first["points"])
+    assert outcome == ("TIGER", True, True, 2)
+    assert first["participant"]["score"] == 2
+    again = client.post(guesses, json={"cells": cells}).json()
+    assert (again["new"], again["points"], again["participant"]["score"]) == (False, 0, 2)
+
+    skipping = [cells[0], cells[2]]
+    assert client.post(guesses, json={"cells": skipping}).status_code == 422
+    assert client.post(guesses, json={"cells": [cells[0], cells[1], cells[0]]}).status_code == 422
+    edit = client.patch(f"/games/{code}/words", json={"words": ["TIGER", "PANDA"]})
+    assert edit.status_code == 422
+    classic = client.post(
+        f"/games/{code}/participants/{player['id']}/selections",
+        json={"selections": [word_ends(tiger)]},
+    )
+    assert classic.status_code == 409
+
+
+def test_edit_clears_completion_and_stale_indexes_are_refused(client):
+    spec = {"title": "Edit", "words": ["LION", "BEAR", "WOLF"], "size": 8, "seed": 5}
+    game = client.post("/games", json=spec).json()
+    code = game["link_code"]
+    player = client.post(f"/games/{code}/participants", json={"username": "done"}).json()
+    selections = [word_ends(w) for w in game["words"]]
+    finished = client.post(
+        f"/games/{code}/participants/{player['id']}/selections", json={"selections": selections}
+    ).json()["participant"]
+    assert finished["completion_time"] is not None
+    # The index another process would still hold after the edit below.
+    with SessionLocal() as db:
+        stale = game_cache.get(db, code)
+
+    edited = client.patch(f"/games/{code}/words", json={"words": ["BEAR", "WOLF", "DEER"]}).json()
+    progress = client.get(f"/games/{code}/participants/{player['id']}").json()
+    assert progress["score"] == 2 and progress["completion_time"] is None
+
+    game_cache._games[code] = stale
+    late = client.post(f"/games/{code}/participants", json={"username": "late"}).json()
+    wolf = next(w for w in game["words"] if w["word"] == "WOLF")
+    result = client.post(
+        f"/games/{code}/participants/{late['id']}/selections",
+        json={"selections": [word_ends(wolf)]},
+    ).json()
+    ordinal = [w["word"] for w in edited["words"]].index("WOLF")
+    assert result["participant"]["found_words"] == 1 << ordinal
+    with SessionLocal() as db:
+        assert game_cache.get(db, code).version == stale.version + 1
+
+
+def test_hidden_message_games_refuse_word_edits(client):
+    spec = {
+        "title": "Pets",
+        "words": ["CAT", "DOG", "FISH", "BIRD", "MOUSE"],
+        "size": 6,
+        "seed": 0,
+        "message": "THE CAT SAT ON A DOG MAT",
+    }
+    game = client.post("/games", json=spec).json()
+    edit = client.patch(f"/games/{game['link_code']}/words", json={"words": ["CAT", "DOG"]})
+    assert edit.status_code == 422
+    assert "hidden-message" in edit.json()["detail"]
+
+
+def test_classic_games_are_capped_at_the_trackable_word_count(client):
+    words = random_words(7, MAX_WORDS + 10, 4, 6)
+    too_many = {"title": "Big", "words": words, "size": 30, "seed": 1}
+    response = client.post("/games", json=too_many)
+    assert response.status_code == 422
+    assert str(MAX_WORDS) in response.json()["detail"]
+
+    game = client.post("/games", json={**too_many, "words": words[:10]}).json()
+    edit = client.patch(f"/games/{game['link_code']}/words", json={"words": words})
+    assert edit.status_code == 422
+
+
+def test_socket_stays_open_on_refusals_and_closes_for_unknown_players(client):
+    spec = {"title": "Traced", "words": ["TIGER"], "size": 5, "seed": 1, "mode": "boggle"}
+    code = client.post("/games", json=spec).json()["link_code"]
+    player = client.post(f"/games/{code}/participants", json={"username": "ws409"}).json()
+    batch = {"selections": [{"start": [0, 0], "end": [0, 2]}]}
+    with client.websocket_connect(f"/games/{code}/participants/{player['id']}/ws") as socket:
+        for _ in range(2):
+            socket.send_json(batch)
+            assert socket.receive_json() == {"error": "Boggle games take traced guesses"}
+    classic = client.post("/games/quick-play", json={"size": 10}).json()["link_code"]
+    with client.websocket_connect(f"/games/{classic}/participants/0/ws") as socket:
+        socket.send_json(batch)
+        assert socket.receive_json() == {"error": "participant not found"}
+        with pytest.raises(WebSocketDisconnect) as closed:
+            socket.receive_json()
+    assert closed.value.code == 1008
+
+
+def test_straight_words_match_cell_by_cell_only_in_full(client):
+    game = client.post("/games/quick-play", json={"size": 10, "difficulty": "easy"}).json()
+    check = f"/games/{game['link_code']}/selections"
+    word = max(game["words"], key=lambda w: len(w["word"]))
+    cells = Placement(word["word"], *decode_position(word["position_data"])[:3]).coordinates()
+    for selection in (cells, cells[::-1]):
+        assert client.post(check, json={"cells": selection}).json()["word_id"] == word["id"]
+    for partial in ([cells[0], cells[-1]], cells[:-1], cells[:2] + cells[3:]):
+        assert not client.post(check, json={"cells": partial}).json()["found"]
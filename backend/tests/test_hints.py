@@ -0,0 +1,52 @@
+import pytest
+
+from app.hints import decode_hints, encode_hints, quadrant, word_hints
+
+from .test_games_api import word_ends
+
+
+@pytest.mark.parametrize(
+    "row, col, expected",
+    [
+        (0, 0, "top-left"),
+        (0, 9, "top-right"),
+        (9, 0, "bottom-left"),
+        (9, 9, "bottom-right"),
+        (4, 5, "top-right"),
+        (5, 4, "bottom-left"),
+    ],
+)
+def test_quadrant_splits_the_grid_in_four(row, col, expected):
+    assert quadrant(row, col, 10, 10) == expected
+
+
+def test_word_hints_go_from_quadrant_to_first_cell():
+    hints = word_hints([(7, 2), (6, 3), (5, 4)], "up_right", 10, 10)
+    assert hints == [
+        {"kind": "quadrant", "value": "bottom-left"},
+        {"kind": "direction", "value": "up_right"},
+        {"kind": "first_cell", "value": [7, 2]},
+    ]
+    assert decode_hints(encode_hints(hints)) == hints
+
+
+def test_hints_endpoint_serves_count_and_remaining(client):
+    spec = {"title": "Hints", "words": ["LION", "BEAR"], "size": 8, "seed": 6}
+    game = client.post("/games", json=spec).json()
+    word = game["words"][0]
+    url = f"/games/{game['link_code']}/words/{word['id']}/hints"
+
+    first = client.get(url).json()
+    assert first["word_id"] == word["id"]
+    assert [h["kind"] for h in first["hints"]] == ["quadrant"]
+    assert first["remaining"] == 2
+    two = client.get(url, params={"count": 2}).json()
+    assert [h["kind"] for h in two["hints"]] == ["quadrant", "direction"]
+    assert two["remaining"] == 1
+    every = client.get(url, params={"count": 5}).json()
+    assert every["hints"][2] == {"kind": "first_cell", "value": list(word_ends(word)["start"])}
+    assert every["remaining"] == 0
+
+    assert client.get(url, params={"count": 0}).status_code == 422
+    missing = f"/games/{game['link_code']}/words/0/hints"
+    assert client.get(missing).status_code == 404
@@ -0,0 +1,145 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.maker import DIRECTION_NAMES, Grid, Maker, Placement
+from app.maker.automaton import Automaton
+from app.maker.deadline import Deadline
+from app.maker.filler import fill_without_duplicates
+from app.maker.grid import encode_word
+from app.maker.placer import CompactPlacer, RandomPlacer
+from app.maker.positions import (
+    decode_position,
+    encode_coordinates,
+    encode_position,
+    position_cells,
+    position_endpoints,
+)
+from app.maker.relayout import relayout
+from app.maker.scan import WordScanner, grid_lines
+from app.solver import solve
+
+from .test_placer import assert_laid_out
+
+ANIMALS = ["ELEPHANT", "GIRAFFE", "BUFFALO", "MONKEY", "JAGUAR", "PYTHON", "OTTER", "LLAMA"]
+
+
+def occurrences(grid, words):
+    found = WordScanner(words).scan(grid.cells, grid.cols, grid_lines(grid.rows, grid.cols))
+    return {(o.word, o.cells) for o in found}
+
+
+def placed(grid, placements):
+    return {(p.word, frozenset(p.indices(grid.cols).tolist())) for p in placements}
+
+
+def test_automaton_finds_every_overlapping_match():
+    rng = random.Random(0)
+    patterns = [[1, 2], [2, 1, 2], [2], [1, 1, 1], [3, 1]]
+    automaton = Automaton(patterns)
+    for _ in range(50):
+        text = [rng.randint(1, 3) for _ in range(30)]
+        expected = {
+            (end, i)
+            for i, pattern in enumerate(patterns)
+            for end in range(len(pattern) - 1, len(text))
+            if text[end - len(pattern) + 1 : end + 1] == pattern
+        }
+        assert set(automaton.iter_matches(text)) == expected
+
+
+@pytest.mark.parametrize("direction", DIRECTION_NAMES)
+def test_positions_round_trip(direction):
+    placement = Placement("WORD", 5, 6, direction)
+    packed = encode_position(5, 6, direction, 4)
+    cells = placement.coordinates()
+    assert decode_position(packed) == (5, 6, direction, 4)
+    assert position_cells(packed) == cells
+    assert position_endpoints(packed) == (cells[0], cells[-1])
+    assert encode_coordinates(cells) == packed
+
+
+def test_positions_outside_the_packed_range_are_rejected():
+    with pytest.raises(ValueError):
+        encode_position(1 << 16, 0, DIRECTION_NAMES[0], 3)
+    with pytest.raises(ValueError):
+        encode_position(0, 0, DIRECTION_NAMES[0], 0)
+
+
+def test_filler_spells_each_word_only_where_it_was_placed():
+    # Filler from the words' own four letters makes repeats likely.
+    words = ["ABC", "CAD", "DBA"]
+    letters = encode_word("ABCD")
+    for seed in range(5):
+        rng = np.random.default_rng(seed)
+        grid = Grid(8, 8)
+        placements = RandomPlacer(DIRECTION_NAMES, rng).place(grid, words)
+        fill_without_duplicates(grid, placements, lambda n: rng.choice(letters, n))
+        assert occurrences(grid, words) == placed(grid, placements)
+
+
+@pytest.mark.parametrize("placer", [RandomPlacer, CompactPlacer])
+def test_greedy_placers_use_only_the_allowed_directions(placer):
+    grid = Grid(12, 12)
+    directions = ("right", "down")
+    placements = placer(directions, np.random.default_rng(1)).place(grid, ANIMALS)
+    assert sorted(p.word for p in placements) == sorted(ANIMALS)
+    assert {p.direction for p in placements} <= set(directions)
+    assert_laid_out(grid, placements)
+
+
+def test_greedy_placer_returns_what_fits_by_the_deadline():
+    grid = Grid(8, 8)
+    words = ANIMALS + ["KANGAROO", "ANTELOPE", "CHEETAH", "GAZELLE", "HYENA"]
+    placer = RandomPlacer(DIRECTION_NAMES, np.random.default_rng(2))
+    placements = placer.place(grid, words, Deadline(0.05))
+    assert 0 < len(placements) < len(words)
+    assert_laid_out(grid, placements)
+
+
+def assert_solves_to_its_placements(puzzle, words):
+    result = solve(puzzle.to_rows(), words)
+    assert result["missing"] == [] and result["ambiguous"] == []
+    solved = {w["word"]: [o["position_data"] for o in w["occurrences"]] for w in result["words"]}
+    assert solved == {w["word"]: [w["position_data"]] for w in puzzle.to_dict()["words"]}
+
+
+@pytest.mark.parametrize("strategy", ["random", "backtrack", "compact"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_solving_the_output_finds_exactly_the_reported_placements(strategy, seed):
+    puzzle = Maker(ANIMALS, 12, seed=seed, strategy=strategy).generate()
+    assert_solves_to_its_placements(puzzle, ANIMALS)
+
+
+def test_hangul_output_solves_to_its_placements():
+    words = ["사과나무", "바나나", "포도밭", "딸기"]
+    assert_solves_to_its_placements(Maker(words, 8, seed=4, alphabet="hangul").generate(), words)
+
+
+def test_relayout_keeps_kept_words_and_places_new_ones_once():
+    puzzle = Maker(ANIMALS, 12, seed=5).generate()
+    rows = puzzle.to_rows()
+    words = [w for w in ANIMALS if w != "BUFFALO"] + ["WALRUS", "BISON"]
+    result = relayout(rows, puzzle.placements, words, seed=5)
+    assert {p.word for p in result.removed} == {"BUFFALO"}
+    assert sorted(p.word for p in result.added) == ["BISON", "WALRUS"]
+    new_rows = result.grid.to_rows()
+    for p in result.kept:
+        cells = p.coordinates()
+        assert [new_rows[r][c] for r, c in cells] == [rows[r][c] for r, c in cells]
+    assert_laid_out(result.grid, result.kept + result.added)
+    assert occurrences(result.grid, words) == placed(result.grid, result.kept + result.added)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_message_puzzle_solves_once_and_reads_back_the_message(seed):
+    words = ["CAT", "DOG", "FISH", "BIRD", "MOUSE"]
+    puzzle = Maker(words, 6, seed=seed, message="THE CAT SAT ON A DOG MAT").generate()
+    assert_solves_to_its_placements(puzzle, words)
+    covered = set()
+    for p in puzzle.placements:
+        covered.update(p.coordinates())
+    rows = puzzle.to_rows()
+    free = [rows[r][c] for r in range(6) for c in range(6) if (r, c) not in covered]
+    assert "".join(free) == "THECATSATONADOGMAT"
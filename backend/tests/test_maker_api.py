@@ -0,0 +1,24 @@
+import json
+
+
+def test_word_outside_alphabet_is_rejected_with_or_without_seed(client):
+    for seed in (None, 1):
+        spec = {"alphabet": "hangul", "words": ["CAT"], "size": 6, "seed": seed}
+        response = client.post("/maker/puzzles", json=spec)
+        assert response.status_code == 422, response.text
+
+
+def test_batch_reports_a_failed_spec_on_its_own_line(client):
+    specs = [
+        {"words": ["CAT", "DOG"], "size": 6, "seed": 1},
+        {"alphabet": "hangul", "words": ["CAT"], "size": 6, "seed": 1},
+    ]
+    response = client.post("/maker/batch", json={"specs": specs})
+    assert response.status_code == 200
+    lines = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert set(lines) == {0, 1}
+    assert "error" not in lines[0]
+    assert "error" in lines[1]
+    game = client.get(f"/games/{lines[0]['link_code']}").json()
+    assert game == {k: v for k, v in lines[0].items() if k != "index"}
+    assert game["title"] == "Puzzle 1"
@@ -0,0 +1,29 @@
+import random
+import string
+
+from app.maker import mega
+from app.maker.mega import generate_bands
+from app.solver import solve
+
+
+def test_streamed_rows_hold_every_reported_placement(monkeypatch):
+    monkeypatch.setattr(mega, "BAND_TIME_BUDGET", 0.2)
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 9))) for _ in range(900)
+    ]
+    rows, placed = [], []
+    for chunk in generate_bands(words, 96, 40, seed=1, band_height=24):
+        if "rows" in chunk:
+            assert chunk["start"] == len(rows)
+            rows += chunk["rows"]
+            placed += chunk["words"]
+    assert len(rows) == 96
+    assert all(len(row) == 40 for row in rows)
+    # Dense enough that some bands need a retry, which used to clear the seam.
+    assert chunk["unplaced"]
+
+    solved = solve(rows, [p.word for p in placed])
+    assert not solved["missing"]
+    for p in placed:
+        assert "".join(rows[r][c] for r, c in p.coordinates()) == p.word
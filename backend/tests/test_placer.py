@@ -0,0 +1,79 @@
+import random
+import string
+import time
+
+import numpy as np
+import pytest
+
+from app.maker.deadline import Deadline
+from app.maker.errors import PlacementError
+from app.maker.grid import DIRECTION_NAMES, EMPTY, Grid, encode_word
+from app.maker.placer import BacktrackingPlacer, _Candidates, _Slots
+
+
+def random_words(seed, count, shortest, longest):
+    rng = random.Random(seed)
+    words = (
+        "".join(rng.choices(string.ascii_uppercase, k=rng.randint(shortest, longest)))
+        for _ in range(count)
+    )
+    return list(dict.fromkeys(words))
+
+
+def assert_laid_out(grid, placements):
+    for p in placements:
+        assert "".join(chr(c) for c in grid.cells[p.indices(grid.cols)]) == p.word
+
+
+def test_incremental_candidates_match_a_rebuild():
+    rng = np.random.default_rng(0)
+    grid = Grid(9, 9)
+    words = random_words(1, 12, 4, 4)
+    codes = np.stack([encode_word(w) for w in words])
+    slots = _Slots(grid, 4, DIRECTION_NAMES)
+    candidates = _Candidates(slots, grid.cells, list(range(len(words))), codes)
+    tokens = []
+    for _ in range(10):
+        legal = np.flatnonzero(candidates.legal[:, 0])
+        if legal.size == 0:
+            break
+        indices = slots.index[rng.choice(legal)]
+        claimed = indices[grid.cells[indices] == EMPTY]
+        grid.cells[indices] = codes[0]
+        tokens.append((claimed, candidates.claim(claimed, grid.cells[claimed])))
+        rebuilt = _Candidates(slots, grid.cells, list(range(len(words))), codes)
+        assert (candidates.legal == rebuilt.legal).all()
+        assert (candidates.fresh == rebuilt.fresh).all()
+        assert (candidates.counts == rebuilt.counts).all()
+    for claimed, token in reversed(tokens):
+        candidates.undo(token)
+        grid.clear(claimed)
+    rebuilt = _Candidates(slots, grid.cells, list(range(len(words))), codes)
+    assert (candidates.legal == rebuilt.legal).all()
+    assert (candidates.fresh == rebuilt.fresh).all()
+
+
+def test_backtracking_places_a_dense_list():
+    grid = Grid(15, 15)
+    words = random_words(2, 40, 4, 7)
+    placements = BacktrackingPlacer(DIRECTION_NAMES, np.random.default_rng(0)).place(grid, words)
+    assert sorted(p.word for p in placements) == sorted(words)
+    assert_laid_out(grid, placements)
+
+
+def test_backtracking_gives_up_after_its_node_budget():
+    placer = BacktrackingPlacer(DIRECTION_NAMES, np.random.default_rng(0), max_nodes=200)
+    with pytest.raises(PlacementError, match="200 search nodes"):
+        placer.place(Grid(15, 15), random_words(3, 65, 4, 7))
+    assert placer._nodes == 201
+
+
+def test_backtracking_stops_at_the_deadline_while_building():
+    grid = Grid(100, 100)
+    words = random_words(4, 400, 4, 12)
+    placer = BacktrackingPlacer(DIRECTION_NAMES, np.random.default_rng(0))
+    started = time.monotonic()
+    placements = placer.place(grid, words, Deadline(0.05))
+    assert time.monotonic() - started < 0.5
+    assert len(placements) < len(words)
+    assert_laid_out(grid, placements)
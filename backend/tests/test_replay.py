@@ -0,0 +1,32 @@
+from app import replay
+from app.config import settings
+
+
+def test_events_round_trip_and_filter_by_participant(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "replay_dir", str(tmp_path))
+    hit = replay.FOUND | replay.NEW
+    replay.append_events(7, 1, [((0, 0), (0, 3), 2, hit), ((5, 5), (1, 1), -1, 0)], at=100.0)
+    replay.append_events(7, 2, [((-3, 4), (70_000, 2), -1, 0)], at=101.5)
+    replay.append_events(7, 1, [((0, 0), (0, 3), 2, replay.FOUND)], at=102.25)
+
+    reader = replay.ReplayReader(replay.log_path(7))
+    assert reader.started_at == 100.0
+    assert len(reader) == 4
+    events = list(reader.iter_events())
+    assert events[0] == {
+        "participant_id": 1,
+        "t": 0.0,
+        "start": [0, 0],
+        "end": [0, 3],
+        "ordinal": 2,
+        "found": True,
+        "new": True,
+    }
+    assert events[1]["ordinal"] is None and not events[1]["found"]
+    # Off-grid cells are kept, clamped to the 16-bit fields.
+    assert (events[2]["start"], events[2]["end"], events[2]["t"]) == ([0, 4], [0xFFFF, 2], 1.5)
+    mine = list(reader.iter_events(1))
+    assert [e["t"] for e in mine] == [0.0, 0.0, 2.25]
+    assert [e["new"] for e in mine] == [True, False, False]
+    assert reader.participant(2).size == 1
+
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.maker import DIRECTION_NAMES, DIRECTIONS, Maker
+from app.maker.grid import BLOCKED, run_lengths
+from app.maker.paths import PathPlacement
+from app.maker.shapes import SHAPES, pack_mask, unpack_mask
+
+WORDS = ["ORBIT", "COMET", "PLANET", "STAR", "MOON", "NOVA"]
+
+
+def naive_run_lengths(mask, direction):
+    dr, dc = DIRECTIONS[direction]
+    rows, cols = mask.shape
+    runs = np.zeros(mask.shape, dtype=int)
+    for r in range(rows):
+        for c in range(cols):
+            row, col = r, c
+            while 0 <= row < rows and 0 <= col < cols and mask[row, col]:
+                runs[r, c] += 1
+                row, col = row + dr, col + dc
+    return runs
+
+
+@pytest.mark.parametrize("direction", DIRECTION_NAMES)
+def test_run_lengths_match_a_cell_by_cell_count(direction):
+    mask = np.random.default_rng(0).random((7, 9)) < 0.7
+    assert (run_lengths(mask, direction) == naive_run_lengths(mask, direction)).all()
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (5, 8), (7, 9), (13, 13)])
+def test_masks_round_trip_through_packing(rows, cols):
+    mask = np.random.default_rng(rows * cols).random((rows, cols)) < 0.5
+    assert (unpack_mask(pack_mask(mask), rows, cols) == mask).all()
+
+
+@pytest.mark.parametrize("strategy", ["random", "backtrack", "snake"])
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_placements_stay_on_usable_cells(strategy, shape):
+    puzzle = Maker(WORDS, 14, seed=1, strategy=strategy, shape=shape).generate()
+    usable = puzzle.grid.mask.ravel()
+    assert len(puzzle.placements) == len(WORDS)
+    for p in puzzle.placements:
+        cells = list(p.cells) if isinstance(p, PathPlacement) else p.indices(puzzle.cols)
+        assert usable[cells].all()
+    assert ((puzzle.grid.cells == BLOCKED) == ~usable).all()
+
+
+def test_shape_bitmap_spec_generates_through_the_api(client):
+    bitmap = ["#" * 10 if r % 3 else "##..##..##" for r in range(10)]
+    spec = {"words": ["ORBIT", "COMET", "STAR"], "size": 10, "seed": 2, "shape_bitmap": bitmap}
+    response = client.post("/maker/puzzles", json=spec)
+    assert response.status_code == 200, response.text
+    puzzle = response.json()
+    mask = unpack_mask(puzzle["mask"], 10, 10)
+    assert (mask == np.array([[ch == "#" for ch in row] for row in bitmap])).all()
+    assert sorted(w["word"] for w in puzzle["words"]) == sorted(spec["words"])
+    for r, row in enumerate(puzzle["grid"]):
+        for c, letter in enumerate(row):
+            assert letter.isalpha() == mask[r, c]
@@ -0,0 +1,23 @@
+import pytest
+
+from app.solver import solve
+
+
+def test_single_cell_and_palindrome_matches_count_once():
+    result = solve(["ABA", "XYZ", "QRS"], ["a", "aba", "y"])
+    occurrences = {w["word"]: w["occurrences"] for w in result["words"]}
+    assert [(o["row"], o["col"]) for o in occurrences["Y"]] == [(1, 1)]
+    assert len(occurrences["A"]) == 2
+    assert len(occurrences["ABA"]) == 1
+    assert result["ambiguous"] == ["A"]
+    assert result["missing"] == []
+
+
+def test_rows_that_change_length_when_upper_cased_are_rejected():
+    with pytest.raises(ValueError, match="row 1"):
+        solve(["STRA", "STRß"], ["STRA"])
+
+
+def test_solve_endpoint_answers_a_bad_grid_with_422(client):
+    response = client.post("/solver/solve", json={"grid": ["ab", "ß1"], "words": ["AB"]})
+    assert response.status_code == 422